@@ -0,0 +1,197 @@
+import os
+import queue
+import threading
+import time
+import numpy as np
+
+# File layout: a fixed header followed by fixed-size little-endian records
+AUDIT_MAGIC = b"BCAUDIT1"
+AUDIT_HEADER_SIZE = 16
+AUDIT_RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("features", "<f8", (30,)),
+    ("confidence", "<f4"),
+    ("prediction", "<i1"),
+    ("model_version", "S19"),
+])
+# Longest model version, in UTF-8 bytes, that fits the model_version field
+AUDIT_MAX_VERSION_BYTES = AUDIT_RECORD_DTYPE["model_version"].itemsize
+
+
+class AuditLog:
+    """
+    Append-only binary log of predictions written by a background thread
+
+    record() only copies the values into a bounded queue, so the request path
+    pays microseconds. The writer thread drains the queue in batches and
+    flushes and fsyncs once per batch. When the queue is full the record is
+    dropped and counted in `dropped`, which callers can poll as back-pressure.
+    Write errors (for example a full disk) are counted in `errors` and the
+    affected batch is lost, but the writer keeps running.
+
+    Reopening an existing log first cuts off any partial record left by a
+    crash, so new records stay aligned.
+    """
+
+    def __init__(self, path="prediction_audit.log", max_queue=10000, batch_size=256,
+                 flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self._closed = False
+
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not new_file:
+            _check_header(path)
+            size = os.path.getsize(path)
+            n_records = (size - AUDIT_HEADER_SIZE) // AUDIT_RECORD_DTYPE.itemsize
+            whole = AUDIT_HEADER_SIZE + n_records * AUDIT_RECORD_DTYPE.itemsize
+            if whole != size:
+                print(f"Discarding {size - whole} bytes of a partial audit record in {path}")
+                os.truncate(path, whole)
+        self._file = open(path, "ab")
+        if new_file:
+            header = AUDIT_MAGIC + np.uint32(AUDIT_RECORD_DTYPE.itemsize).tobytes()
+            self._file.write(header.ljust(AUDIT_HEADER_SIZE, b"\0"))
+            self._file.flush()
+
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, features, prediction, confidence, model_version=""):
+        """
+        Queue one prediction for writing
+
+        Raises:
+            ValueError: If features does not hold 30 values or model_version
+                is longer than AUDIT_MAX_VERSION_BYTES
+
+        Returns:
+            bool: False if the record was dropped because the queue is full
+                or the log is closed
+        """
+        features = np.asarray(features, dtype=np.float64).ravel()
+        if len(features) != 30:
+            raise ValueError(f"Expected 30 features, got {len(features)}")
+        version = str(model_version).encode()
+        if len(version) > AUDIT_MAX_VERSION_BYTES:
+            raise ValueError(f"model_version {model_version!r} is longer than "
+                             f"{AUDIT_MAX_VERSION_BYTES} bytes and cannot be logged")
+        item = (time.time(), features, confidence, prediction, version)
+        if self._closed:
+            self.dropped += 1
+            return False
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def backlog(self):
+        """Number of records waiting to be written"""
+        return self.queue.qsize()
+
+    def stats(self):
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "backlog": self.backlog(),
+        }
+
+    def close(self):
+        """Write everything still queued, fsync and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        # Never block on a full queue if the writer is gone
+        while self._thread.is_alive():
+            try:
+                self.queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        self._thread.join()
+        self._file.close()
+
+    def _run(self):
+        batch = np.zeros(self.batch_size, dtype=AUDIT_RECORD_DTYPE)
+        stop = False
+        while not stop:
+            n = 0
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            while item is not None:
+                row = batch[n]
+                try:
+                    row["timestamp"], row["features"], row["confidence"], row["prediction"], row["model_version"] = (
+                        item[0], item[1], item[2], item[3], item[4]
+                    )
+                    n += 1
+                except Exception as e:
+                    print(f"Skipping bad audit record: {e}")
+                    self.errors += 1
+                if n == self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                stop = True
+            if n:
+                self._write(batch[:n])
+
+    def _write(self, records):
+        """Append and fsync one batch; on failure drop it and keep the file aligned"""
+        offset = self._file.tell()
+        try:
+            self._file.write(records.tobytes())
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.written += len(records)
+        except OSError as e:
+            print(f"Error writing audit log: {e}")
+            self.errors += 1
+            try:
+                self._file.truncate(offset)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _check_header(path):
+    with open(path, "rb") as f:
+        header = f.read(AUDIT_HEADER_SIZE)
+    if header[:len(AUDIT_MAGIC)] != AUDIT_MAGIC:
+        raise ValueError(f"{path} is not a prediction audit log")
+    record_size = int(np.frombuffer(header[len(AUDIT_MAGIC):len(AUDIT_MAGIC) + 4], dtype="<u4")[0])
+    if record_size != AUDIT_RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path} has record size {record_size}, expected {AUDIT_RECORD_DTYPE.itemsize}")
+
+
+def read_audit_log(path):
+    """
+    Memory-map an audit log as a NumPy structured array
+
+    Fields are timestamp, features (30 values), confidence, prediction and
+    model_version. A partially written trailing record is ignored.
+    """
+    _check_header(path)
+    n_records = (os.path.getsize(path) - AUDIT_HEADER_SIZE) // AUDIT_RECORD_DTYPE.itemsize
+    if n_records == 0:
+        return np.zeros(0, dtype=AUDIT_RECORD_DTYPE)
+    return np.memmap(path, dtype=AUDIT_RECORD_DTYPE, mode="r",
+                     offset=AUDIT_HEADER_SIZE, shape=(n_records,))
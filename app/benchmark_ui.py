@@ -0,0 +1,171 @@
+"""
+Headless UI latency benchmark
+
+Runs MainWindow under the offscreen Qt platform, clicks the sample, generate
+and analyze buttons N times each and writes a JSON report with the click to
+label update latency and the event loop stall time. Modal message boxes are
+stubbed out so nothing waits for user input.
+
+    python app/benchmark_ui.py --iterations 200 --output ui_benchmark.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtCore import QT_VERSION_STR, Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+HEARTBEAT_MS = 1
+
+
+def stub_message_boxes():
+    """Replace the modal QMessageBox helpers with ones that return immediately"""
+    def answer(*args, **kwargs):
+        return QMessageBox.StandardButton.Ok
+
+    for name in ("information", "warning", "critical", "question"):
+        setattr(QMessageBox, name, staticmethod(answer))
+
+
+def summarize(samples_ms):
+    samples = np.asarray(samples_ms, dtype=np.float64)
+    if len(samples) == 0:
+        return {"count": 0}
+    return {
+        "count": int(len(samples)),
+        "mean_ms": float(samples.mean()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "max_ms": float(samples.max()),
+    }
+
+
+def run_benchmark(iterations=100):
+    """
+    Drive the main window and measure its responsiveness
+
+    Args:
+        iterations (int): Clicks per action
+
+    Returns:
+        dict: JSON-serialisable benchmark report
+    """
+    from main import MainWindow
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle('Fusion')
+    stub_message_boxes()
+
+    start = time.perf_counter()
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    actions = [
+        ("load_sample_malignant", window.sample_malignant_btn, lambda: window.feature_inputs["mean_radius"].text()),
+        ("generate_random_data", window.generate_btn, lambda: window.feature_inputs["mean_radius"].text()),
+        ("predict_diagnosis", window.predict_btn, lambda: window.result_label.text()),
+    ]
+    latencies = {name: [] for name, _, _ in actions}
+    schedule = [action for _ in range(iterations) for action in actions]
+
+    # A fast heartbeat timer; any gap beyond its interval is time the event loop was blocked
+    ticks = []
+    heartbeat = QTimer()
+    heartbeat.setTimerType(Qt.TimerType.PreciseTimer)
+    heartbeat.setInterval(HEARTBEAT_MS)
+    heartbeat.timeout.connect(lambda: ticks.append(time.perf_counter()))
+
+    def step():
+        if not schedule:
+            heartbeat.stop()
+            app.quit()
+            return
+        name, button, read_label = schedule.pop(0)
+        if name == "generate_random_data":
+            # Blank seed so every click generates fresh values
+            window.seed_input.clear()
+        t0 = time.perf_counter()
+        button.click()
+        read_label()
+        # Deliver the repaint triggered by the update before stopping the clock
+        app.processEvents()
+        latencies[name].append((time.perf_counter() - t0) * 1000)
+        QTimer.singleShot(0, step)
+
+    heartbeat.start()
+    QTimer.singleShot(0, step)
+    loop_start = time.perf_counter()
+    app.exec()
+    loop_ms = (time.perf_counter() - loop_start) * 1000
+
+    gaps = np.diff(np.asarray(ticks)) * 1000 if len(ticks) > 1 else np.zeros(0)
+    stalls = np.clip(gaps - HEARTBEAT_MS, 0, None)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "platform": platform.platform(),
+        "qpa_platform": os.environ.get("QT_QPA_PLATFORM"),
+        "iterations": iterations,
+        "startup_ms": startup_ms,
+        "startup_phases_ms": {name: ms for name, ms in window.profiler.phases},
+        "latency": {name: summarize(samples) for name, samples in latencies.items()},
+        "event_loop": {
+            "duration_ms": loop_ms,
+            "heartbeat_interval_ms": HEARTBEAT_MS,
+            "stall": summarize(stalls),
+            "total_stall_ms": float(stalls.sum()),
+            "stalls_over_16ms": int((stalls > 16).sum()),
+        },
+    }
+    window.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless MainWindow latency benchmark")
+    parser.add_argument("--iterations", type=int, default=100, help="Clicks per action")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    cwd = os.getcwd()
+    # Run in a scratch directory so benchmark predictions never reach the real
+    # audit log and database; reuse the model artifacts if they exist here
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in ("svm_model.pkl", "scaler.pkl", "calibrator.pkl"):
+            if os.path.exists(os.path.join(cwd, name)):
+                shutil.copy(os.path.join(cwd, name), workdir)
+        os.chdir(workdir)
+        try:
+            report = run_benchmark(args.iterations)
+        finally:
+            os.chdir(cwd)
+
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(text + "\n")
+        print(f"Benchmark report written to {output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
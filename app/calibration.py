@@ -0,0 +1,86 @@
+import numpy as np
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+
+
+class DecisionCalibrator:
+    """
+    Map SVC decision values to probabilities of the positive class
+
+    This replaces SVC(probability=True), which makes libsvm run an internal
+    5-fold cross-validation during training. The SVC is fitted once without
+    probabilities and this mapping is fitted on held-out decision values.
+
+    method is 'sigmoid' (Platt scaling, p = 1 / (1 + exp(a*d + b))) or
+    'isotonic' (monotone step function, better with plenty of data).
+
+    The predicted label is the sign of the decision value, so both methods
+    are constrained to p = 0.5 at d = 0: the sigmoid is fitted without an
+    intercept (b = 0) and the isotonic output is clipped to [0.5, 1] for
+    positive and [0, 0.5] for other decision values. The predicted class
+    therefore never gets a confidence below 50%.
+    """
+
+    def __init__(self, method="sigmoid"):
+        if method not in ("sigmoid", "isotonic"):
+            raise ValueError(f"Unknown calibration method: {method}")
+        self.method = method
+        self.a = None
+        self.b = None
+        self.isotonic = None
+        # Set by train_model to the hash of the svm_model.pkl it belongs to
+        self.model_version = None
+
+    def fit(self, decision_values, labels):
+        """
+        Fit the mapping on held-out data
+
+        Args:
+            decision_values (array-like): SVC decision_function outputs
+            labels (array-like): True labels, 1 for the positive class
+        """
+        decision_values = np.asarray(decision_values, dtype=np.float64).ravel()
+        labels = np.asarray(labels).ravel()
+        if self.method == "sigmoid":
+            lr = LogisticRegression(C=1e6, fit_intercept=False)
+            lr.fit(decision_values.reshape(-1, 1), labels)
+            self.a = -float(lr.coef_[0, 0])
+            self.b = 0.0
+        else:
+            self.isotonic = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip")
+            self.isotonic.fit(decision_values, labels)
+        return self
+
+    def predict_proba(self, decision_values):
+        """Return the probability of the positive class for each decision value"""
+        decision_values = np.asarray(decision_values, dtype=np.float64).ravel()
+        if self.method == "sigmoid":
+            if self.a is None:
+                raise ValueError("Calibrator is not fitted")
+            return 1.0 / (1.0 + np.exp(self.a * decision_values + self.b))
+        if self.isotonic is None:
+            raise ValueError("Calibrator is not fitted")
+        proba = self.isotonic.predict(decision_values)
+        return np.where(decision_values > 0, np.maximum(proba, 0.5), np.minimum(proba, 0.5))
+
+    @classmethod
+    def from_svc(cls, model):
+        """
+        Build a sigmoid calibrator for a saved SVC that has no separate calibrator
+
+        Models trained with probability=True already carry Platt parameters
+        (probA_, probB_); the slope is reused and the offset dropped so that
+        p = 0.5 at d = 0 (see the class docstring). Otherwise the decision value goes
+        through a plain logistic function, which orders cases correctly but is
+        not calibrated.
+        """
+        calibrator = cls("sigmoid")
+        prob_a = getattr(model, "probA_", None)
+        if prob_a is not None and len(prob_a) == 1:
+            # libsvm applies the sigmoid to the negated decision value
+            calibrator.a = float(model.probA_[0])
+            calibrator.b = 0.0
+        else:
+            calibrator.a = -1.0
+            calibrator.b = 0.0
+        return calibrator
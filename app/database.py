@@ -0,0 +1,263 @@
+import queue
+import sqlite3
+import threading
+import time
+import numpy as np
+from model import FEATURE_NAMES
+
+MEASUREMENT_COLUMNS = ", ".join(FEATURE_NAMES)
+MEASUREMENT_PLACEHOLDERS = ", ".join("?" for _ in FEATURE_NAMES)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS patients (
+    id INTEGER PRIMARY KEY,
+    external_id TEXT UNIQUE,
+    name TEXT,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY,
+    patient_id INTEGER REFERENCES patients(id),
+    created_at REAL NOT NULL,
+    {", ".join(f"{name} REAL NOT NULL" for name in FEATURE_NAMES)}
+);
+
+CREATE TABLE IF NOT EXISTS predictions (
+    id INTEGER PRIMARY KEY,
+    measurement_id INTEGER NOT NULL REFERENCES measurements(id),
+    patient_id INTEGER REFERENCES patients(id),
+    diagnosis INTEGER NOT NULL,
+    confidence REAL NOT NULL,
+    model_version TEXT,
+    created_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_measurements_patient ON measurements(patient_id);
+CREATE INDEX IF NOT EXISTS idx_predictions_patient ON predictions(patient_id);
+CREATE INDEX IF NOT EXISTS idx_predictions_diagnosis ON predictions(diagnosis);
+CREATE INDEX IF NOT EXISTS idx_predictions_created_at ON predictions(created_at);
+"""
+
+INSERT_MEASUREMENT = (
+    f"INSERT INTO measurements (id, patient_id, created_at, {MEASUREMENT_COLUMNS}) "
+    f"VALUES (?, ?, ?, {MEASUREMENT_PLACEHOLDERS})"
+)
+INSERT_PREDICTION = (
+    "INSERT INTO predictions (measurement_id, patient_id, diagnosis, confidence, model_version, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+class PatientStore:
+    """
+    SQLite store for patients, their measurements and predictions
+
+    The database runs in WAL mode so readers never block the writer. All
+    statements use fixed SQL text with parameters, which sqlite3 keeps in its
+    statement cache, and batches go through executemany in one transaction.
+    A PatientStore connection must only be used from the thread that made it.
+    """
+
+    def __init__(self, path="patients.db"):
+        self.path = path
+        self.conn = sqlite3.connect(path, isolation_level=None, cached_statements=64)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def add_patient(self, external_id=None, name=None):
+        """Create a patient and return its id"""
+        cur = self.conn.execute(
+            "INSERT INTO patients (external_id, name, created_at) VALUES (?, ?, ?)",
+            (external_id, name, time.time()),
+        )
+        return cur.lastrowid
+
+    def get_patient(self, patient_id):
+        row = self.conn.execute(
+            "SELECT id, external_id, name, created_at FROM patients WHERE id = ?", (patient_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("id", "external_id", "name", "created_at"), row))
+
+    def save_prediction(self, features, diagnosis, confidence, patient_id=None, model_version=None):
+        """Store one measurement with its prediction and return the measurement id"""
+        return self.save_predictions([features], [diagnosis], [confidence],
+                                     patient_ids=[patient_id], model_version=model_version)[0]
+
+    def save_predictions(self, features, diagnoses, confidences, patient_ids=None, model_version=None):
+        """
+        Bulk insert scored rows in a single transaction
+
+        Args:
+            features (array-like): Shape (n, 30) measurement values
+            diagnoses (array-like): Predicted labels, 0 or 1
+            confidences (array-like): Confidence of each prediction
+            patient_ids (list): Optional patient id per row
+
+        Returns:
+            list: The measurement ids of the inserted rows
+        """
+        features = np.asarray(features, dtype=np.float64).reshape(-1, len(FEATURE_NAMES))
+        n = len(features)
+        if n == 0:
+            return []
+        if patient_ids is None:
+            patient_ids = [None] * n
+        now = time.time()
+        diagnoses = np.asarray(diagnoses, dtype=np.int64).tolist()
+        confidences = np.asarray(confidences, dtype=np.float64).tolist()
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Allocate ids up front so predictions can reference their measurement
+            # without a round trip per row; safe because we hold the write lock
+            first_id = self.conn.execute(
+                "SELECT COALESCE(MAX(id), 0) + 1 FROM measurements"
+            ).fetchone()[0]
+            ids = list(range(first_id, first_id + n))
+            self.conn.executemany(
+                INSERT_MEASUREMENT,
+                ((mid, pid, now, *row) for mid, pid, row in zip(ids, patient_ids, features.tolist())),
+            )
+            self.conn.executemany(
+                INSERT_PREDICTION,
+                zip(ids, patient_ids, diagnoses, confidences, [model_version] * n, [now] * n),
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return ids
+
+    def get_predictions(self, diagnosis=None, patient_id=None, since=None, until=None, limit=None):
+        """
+        Query stored predictions, newest first
+
+        Returns:
+            list: One dict per prediction with its measurement values
+        """
+        clauses, params = [], []
+        if diagnosis is not None:
+            clauses.append("p.diagnosis = ?")
+            params.append(int(diagnosis))
+        if patient_id is not None:
+            clauses.append("p.patient_id = ?")
+            params.append(patient_id)
+        if since is not None:
+            clauses.append("p.created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("p.created_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT p.id, p.measurement_id, p.patient_id, p.diagnosis, p.confidence, "
+            f"p.model_version, p.created_at, {', '.join('m.' + name for name in FEATURE_NAMES)} "
+            f"FROM predictions p JOIN measurements m ON m.id = p.measurement_id {where} "
+            "ORDER BY p.created_at DESC, p.id DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        keys = ["id", "measurement_id", "patient_id", "diagnosis", "confidence",
+                "model_version", "created_at"]
+        results = []
+        for row in self.conn.execute(sql, params):
+            record = dict(zip(keys, row[:len(keys)]))
+            record["features"] = list(row[len(keys):])
+            results.append(record)
+        return results
+
+    def get_patient_history(self, patient_id):
+        return self.get_predictions(patient_id=patient_id)
+
+    def count_by_diagnosis(self):
+        """Return {diagnosis: count} over all stored predictions"""
+        return dict(self.conn.execute(
+            "SELECT diagnosis, COUNT(*) FROM predictions GROUP BY diagnosis"
+        ).fetchall())
+
+
+class DatabaseWriter:
+    """
+    Background thread that owns a PatientStore and performs writes for the GUI
+
+    save_prediction() only enqueues, so the UI thread never waits on disk.
+    Queued single predictions are grouped into one transaction.
+    """
+
+    def __init__(self, path="patients.db", batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.errors = []
+        self._ready = threading.Event()
+        self._startup_error = None
+        self._thread = threading.Thread(target=self._run, name="database-writer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            self._thread.join()
+            raise self._startup_error
+
+    def save_prediction(self, features, diagnosis, confidence, patient_id=None, model_version=None):
+        self.queue.put((list(features), int(diagnosis), float(confidence), patient_id, model_version))
+
+    def close(self):
+        """Finish pending writes and stop the thread"""
+        self.queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        try:
+            store = PatientStore(self.path)
+        except Exception as e:
+            self._startup_error = e
+            return
+        finally:
+            # Always release __init__, which re-raises a failed open
+            self._ready.set()
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stop = True
+                batch = [item for item in batch if item is not None]
+            # Rows are grouped per model version so one executemany covers each group
+            groups = {}
+            for item in batch:
+                groups.setdefault(item[4], []).append(item)
+            for model_version, items in groups.items():
+                try:
+                    self._save(store, items, model_version)
+                except Exception:
+                    # Retry row by row so one bad row does not drop the rest of the batch
+                    for item in items:
+                        try:
+                            self._save(store, [item], model_version)
+                        except Exception as e:
+                            # Keep the writer alive so later saves are not lost
+                            print(f"Error saving prediction: {e}")
+                            self.errors.append(e)
+        store.close()
+
+    def _save(self, store, items, model_version):
+        store.save_predictions(
+            [item[0] for item in items],
+            [item[1] for item in items],
+            [item[2] for item in items],
+            patient_ids=[item[3] for item in items],
+            model_version=model_version,
+        )
@@ -0,0 +1,227 @@
+import threading
+from statistics import NormalDist
+import numpy as np
+
+
+class DriftMonitor:
+    """
+    Streaming comparison of live inputs against the training distribution
+
+    Works on inputs already standardised by the fitted scaler, so the training
+    distribution of every feature has mean 0 and variance 1 and the running
+    mean of the standardised values is the standardised mean shift directly.
+    Per feature it keeps Welford running moments and a fixed-bin histogram,
+    which costs O(30) per prediction and one vectorised update per batch.
+
+    The drift checks run on a recent window rather than the all-time totals,
+    which a long run of normal traffic would otherwise dilute: next to the
+    cumulative statistics the monitor keeps exponentially decayed sums and
+    histogram counts with a half-life of half_life observations. That is
+    still O(30) per prediction, and a sudden shift (for example a device
+    recalibration) is flagged after a few hundred inputs however long the
+    monitor has been running. report() shows both views.
+
+    Histogram bins are the quantiles of a standard normal. Several features
+    are strongly skewed, so a normal baseline would report PSI drift on
+    training data itself; PSI is therefore only checked once the scaled
+    training data has been passed to set_reference(). Until then only the
+    mean shift raises a flag. PSI is also noisy on small samples (its
+    expected value is about n_bins / count even without drift), so it needs
+    a window weight of psi_min_samples before it can flag a feature.
+    """
+
+    def __init__(self, feature_names, n_bins=10, mean_shift_threshold=0.5,
+                 psi_threshold=0.2, min_samples=50, psi_min_samples=None, check_interval=10,
+                 half_life=500):
+        self.feature_names = list(feature_names)
+        self.n_features = len(self.feature_names)
+        self.n_bins = n_bins
+        self.mean_shift_threshold = mean_shift_threshold
+        self.psi_threshold = psi_threshold
+        self.min_samples = min_samples
+        self.psi_min_samples = psi_min_samples if psi_min_samples is not None else 25 * n_bins
+        # Thresholds are re-evaluated every check_interval single-row updates
+        self.check_interval = check_interval
+        self.half_life = half_life
+        # Per-observation decay of the recent window
+        self.decay = 0.5 ** (1.0 / half_life)
+        # Inner bin edges; the outer bins are open-ended
+        normal = NormalDist()
+        self.edges = np.array([normal.inv_cdf(i / n_bins) for i in range(1, n_bins)])
+        self.reference = np.full((self.n_features, n_bins), 1.0 / n_bins)
+        self.has_reference = False
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget all live observations"""
+        with self._lock:
+            self.count = 0
+            self.mean = np.zeros(self.n_features)
+            self.m2 = np.zeros(self.n_features)
+            self.hist = np.zeros((self.n_features, self.n_bins), dtype=np.int64)
+            # Exponentially decayed weight, sums and histogram of the recent window
+            self.recent_weight = 0.0
+            self.recent_sum = np.zeros(self.n_features)
+            self.recent_sq_sum = np.zeros(self.n_features)
+            self.recent_hist = np.zeros((self.n_features, self.n_bins))
+            self.flagged = []
+            self._since_check = 0
+
+    def set_reference(self, scaled_training_data):
+        """Use the bin proportions of the (scaled) training data as the PSI baseline"""
+        bins = np.searchsorted(self.edges, np.asarray(scaled_training_data, dtype=np.float64))
+        counts = np.stack([np.bincount(bins[:, j], minlength=self.n_bins)
+                           for j in range(self.n_features)])
+        self.reference = counts / counts.sum(axis=1, keepdims=True)
+        self.has_reference = True
+
+    def update(self, scaled_features):
+        """
+        Add standardised inputs of shape (30,) or (n, 30)
+
+        Returns:
+            list: Names of the features currently flagged as drifted
+        """
+        z = np.asarray(scaled_features, dtype=np.float64)
+        if z.ndim == 1:
+            z = z.reshape(1, -1)
+        n = len(z)
+        if n == 0:
+            return self.flagged
+        bins = np.searchsorted(self.edges, z)
+
+        with self._lock:
+            if n == 1:
+                # Welford update for a single row
+                self.count += 1
+                delta = z[0] - self.mean
+                self.mean += delta / self.count
+                self.m2 += delta * (z[0] - self.mean)
+                self.hist[np.arange(self.n_features), bins[0]] += 1
+                self.recent_weight = self.decay * self.recent_weight + 1.0
+                self.recent_sum = self.decay * self.recent_sum + z[0]
+                self.recent_sq_sum = self.decay * self.recent_sq_sum + z[0] ** 2
+                self.recent_hist *= self.decay
+                self.recent_hist[np.arange(self.n_features), bins[0]] += 1.0
+            else:
+                # Chan et al. merge of the batch moments
+                batch_mean = z.mean(axis=0)
+                batch_m2 = ((z - batch_mean) ** 2).sum(axis=0)
+                total = self.count + n
+                delta = batch_mean - self.mean
+                self.mean += delta * n / total
+                self.m2 += batch_m2 + delta ** 2 * self.count * n / total
+                self.count = total
+                # Same result as n single updates: the last row has weight 1
+                weights = self.decay ** np.arange(n - 1, -1, -1, dtype=np.float64)
+                old = self.decay ** n
+                self.recent_weight = old * self.recent_weight + weights.sum()
+                self.recent_sum = old * self.recent_sum + weights @ z
+                self.recent_sq_sum = old * self.recent_sq_sum + weights @ z ** 2
+                self.recent_hist *= old
+                for j in range(self.n_features):
+                    self.hist[j] += np.bincount(bins[:, j], minlength=self.n_bins)
+                    self.recent_hist[j] += np.bincount(bins[:, j], weights=weights, minlength=self.n_bins)
+
+            self._since_check += n
+            if self._since_check >= self.check_interval and self.recent_weight >= self.min_samples:
+                self._since_check = 0
+                self._check()
+            return self.flagged
+
+    def _check(self):
+        """Flag features whose recent window has drifted"""
+        drifted = np.abs(self.recent_sum / self.recent_weight) > self.mean_shift_threshold
+        if self.has_reference and self.recent_weight >= self.psi_min_samples:
+            drifted |= self._psi(self.recent_hist, self.recent_weight) > self.psi_threshold
+        flagged = [self.feature_names[j] for j in np.flatnonzero(drifted)]
+        newly_flagged = set(flagged) - set(self.flagged)
+        self.flagged = flagged
+        if newly_flagged:
+            print(f"Input drift detected in: {', '.join(sorted(newly_flagged))}")
+
+    def _psi(self, hist, weight):
+        eps = 1e-6
+        actual = hist / max(weight, 1)
+        actual = np.clip(actual, eps, None)
+        expected = np.clip(self.reference, eps, None)
+        return ((actual - expected) * np.log(actual / expected)).sum(axis=1)
+
+    @property
+    def drifted(self):
+        return bool(self.flagged)
+
+    def report(self):
+        """Per-feature drift statistics as a dict keyed by feature name"""
+        with self._lock:
+            variance = self.m2 / self.count if self.count else np.full(self.n_features, np.nan)
+            psi = self._psi(self.hist, self.count)
+            if self.recent_weight:
+                recent_mean = self.recent_sum / self.recent_weight
+                recent_variance = self.recent_sq_sum / self.recent_weight - recent_mean ** 2
+            else:
+                recent_mean = recent_variance = np.full(self.n_features, np.nan)
+            recent_psi = self._psi(self.recent_hist, self.recent_weight)
+            return {
+                name: {
+                    "mean_shift": float(self.mean[j]),
+                    "variance_ratio": float(variance[j]),
+                    "psi": float(psi[j]),
+                    "recent_mean_shift": float(recent_mean[j]),
+                    "recent_variance_ratio": float(recent_variance[j]),
+                    "recent_psi": float(recent_psi[j]),
+                    "drifted": name in self.flagged,
+                }
+                for j, name in enumerate(self.feature_names)
+            }
+
+    def export_state(self):
+        """Return the full monitor state as plain Python types"""
+        with self._lock:
+            return {
+                "feature_names": self.feature_names,
+                "count": self.count,
+                "mean": self.mean.tolist(),
+                "m2": self.m2.tolist(),
+                "hist": self.hist.tolist(),
+                "recent_weight": self.recent_weight,
+                "recent_sum": self.recent_sum.tolist(),
+                "recent_sq_sum": self.recent_sq_sum.tolist(),
+                "recent_hist": self.recent_hist.tolist(),
+                "edges": self.edges.tolist(),
+                "reference": self.reference.tolist(),
+                "has_reference": self.has_reference,
+                "flagged": list(self.flagged),
+                "thresholds": {
+                    "mean_shift": self.mean_shift_threshold,
+                    "psi": self.psi_threshold,
+                    "min_samples": self.min_samples,
+                    "psi_min_samples": self.psi_min_samples,
+                    "check_interval": self.check_interval,
+                    "half_life": self.half_life,
+                },
+            }
+
+    @classmethod
+    def from_state(cls, state):
+        thresholds = state["thresholds"]
+        monitor = cls(state["feature_names"], n_bins=len(state["edges"]) + 1,
+                      mean_shift_threshold=thresholds["mean_shift"],
+                      psi_threshold=thresholds["psi"], min_samples=thresholds["min_samples"],
+                      psi_min_samples=thresholds["psi_min_samples"],
+                      check_interval=thresholds["check_interval"],
+                      half_life=thresholds["half_life"])
+        monitor.edges = np.array(state["edges"])
+        monitor.reference = np.array(state["reference"])
+        monitor.has_reference = state["has_reference"]
+        monitor.count = state["count"]
+        monitor.mean = np.array(state["mean"])
+        monitor.m2 = np.array(state["m2"])
+        monitor.hist = np.array(state["hist"], dtype=np.int64)
+        monitor.recent_weight = state["recent_weight"]
+        monitor.recent_sum = np.array(state["recent_sum"])
+        monitor.recent_sq_sum = np.array(state["recent_sq_sum"])
+        monitor.recent_hist = np.array(state["recent_hist"])
+        monitor.flagged = list(state["flagged"])
+        return monitor
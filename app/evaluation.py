@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+
+class StreamingEvaluator:
+    """Constant-memory evaluation metrics accumulated over streamed chunks.
+
+    Each chunk is a set of (label, prediction, confidence) triples where
+    confidence is the probability of the predicted class, as returned by
+    BreastCancerPredictor.predict. Only fixed-size counters are kept, so
+    evaluators built on different shards can be merged with merge().
+    """
+
+    def __init__(self, n_bins=100, n_calibration_bins=10):
+        self.n_bins = n_bins
+        self.n_calibration_bins = n_calibration_bins
+        self.confusion = np.zeros((2, 2), dtype=np.int64)
+        # Histograms of the malignant score for each true class (ROC AUC)
+        self.positive_hist = np.zeros(n_bins, dtype=np.int64)
+        self.negative_hist = np.zeros(n_bins, dtype=np.int64)
+        # Reliability curve: count, summed confidence and correct count per bin
+        self.calibration_count = np.zeros(n_calibration_bins, dtype=np.int64)
+        self.calibration_confidence = np.zeros(n_calibration_bins, dtype=np.float64)
+        self.calibration_correct = np.zeros(n_calibration_bins, dtype=np.int64)
+
+    @property
+    def n_samples(self):
+        return int(self.confusion.sum())
+
+    def update(self, labels, predictions, confidences):
+        """
+        Add one chunk of scored rows to the running totals
+
+        Args:
+            labels (array-like): True labels, 0 (benign) or 1 (malignant)
+            predictions (array-like): Predicted labels, 0 or 1
+            confidences (array-like): Probability of the predicted class
+
+        Raises:
+            ValueError: If a label or prediction is not 0 or 1; rows with an
+                unknown diagnosis (-1 in load_worklist_csv) must be removed
+                by the caller
+        """
+        labels = np.asarray(labels, dtype=np.int64).ravel()
+        predictions = np.asarray(predictions, dtype=np.int64).ravel()
+        confidences = np.asarray(confidences, dtype=np.float64).ravel()
+
+        if not (len(labels) == len(predictions) == len(confidences)):
+            raise ValueError("labels, predictions and confidences must have the same length")
+        if len(labels) == 0:
+            return
+        for name, values in (("labels", labels), ("predictions", predictions)):
+            invalid = (values != 0) & (values != 1)
+            if invalid.any():
+                raise ValueError(f"{name} must be 0 or 1, found {sorted(set(values[invalid].tolist()))[:5]}")
+
+        self.confusion += np.bincount(
+            labels * 2 + predictions, minlength=4
+        ).reshape(2, 2)
+
+        # Probability of the malignant class, used as the ROC score
+        scores = np.where(predictions == 1, confidences, 1.0 - confidences)
+        score_bins = self._bin_index(scores, self.n_bins)
+        self.positive_hist += np.bincount(score_bins[labels == 1], minlength=self.n_bins)
+        self.negative_hist += np.bincount(score_bins[labels == 0], minlength=self.n_bins)
+
+        confidence_bins = self._bin_index(confidences, self.n_calibration_bins)
+        correct = (labels == predictions).astype(np.int64)
+        self.calibration_count += np.bincount(confidence_bins, minlength=self.n_calibration_bins)
+        self.calibration_confidence += np.bincount(
+            confidence_bins, weights=confidences, minlength=self.n_calibration_bins
+        )
+        self.calibration_correct += np.bincount(
+            confidence_bins, weights=correct, minlength=self.n_calibration_bins
+        ).astype(np.int64)
+
+    def merge(self, other):
+        """Fold the counters of another evaluator (e.g. from another shard) into this one"""
+        if (other.n_bins, other.n_calibration_bins) != (self.n_bins, self.n_calibration_bins):
+            raise ValueError("Cannot merge evaluators with different bin counts")
+        self.confusion += other.confusion
+        self.positive_hist += other.positive_hist
+        self.negative_hist += other.negative_hist
+        self.calibration_count += other.calibration_count
+        self.calibration_confidence += other.calibration_confidence
+        self.calibration_correct += other.calibration_correct
+        return self
+
+    def accuracy(self):
+        total = self.n_samples
+        if total == 0:
+            return float("nan")
+        return float(np.trace(self.confusion)) / total
+
+    def recall_per_class(self):
+        """Return recall for benign (0) and malignant (1) as a dict"""
+        support = self.confusion.sum(axis=1)
+        recall = {}
+        for cls in (0, 1):
+            recall[cls] = float(self.confusion[cls, cls] / support[cls]) if support[cls] else float("nan")
+        return recall
+
+    def roc_auc(self):
+        """
+        ROC AUC computed from the binned score histograms
+
+        Rows sharing a bin are treated as ties, so the result is exact up to
+        the bin resolution.
+        """
+        n_pos = self.positive_hist.sum()
+        n_neg = self.negative_hist.sum()
+        if n_pos == 0 or n_neg == 0:
+            return float("nan")
+        # Negatives strictly below each bin, plus half of the ties inside it
+        negatives_below = np.cumsum(self.negative_hist) - self.negative_hist
+        wins = self.positive_hist * (negatives_below + 0.5 * self.negative_hist)
+        return float(wins.sum() / (n_pos * n_neg))
+
+    def roc_curve(self):
+        """Return (false_positive_rate, true_positive_rate) at every bin edge"""
+        n_pos = max(self.positive_hist.sum(), 1)
+        n_neg = max(self.negative_hist.sum(), 1)
+        tpr = np.concatenate(([0.0], np.cumsum(self.positive_hist[::-1]) / n_pos))
+        fpr = np.concatenate(([0.0], np.cumsum(self.negative_hist[::-1]) / n_neg))
+        return fpr, tpr
+
+    def calibration_curve(self):
+        """
+        Reliability curve over the confidence bins
+
+        Returns:
+            tuple: (mean_confidence, accuracy, count) per non-empty bin
+        """
+        mask = self.calibration_count > 0
+        count = self.calibration_count[mask]
+        mean_confidence = self.calibration_confidence[mask] / count
+        accuracy = self.calibration_correct[mask] / count
+        return mean_confidence, accuracy, count
+
+    def expected_calibration_error(self):
+        mean_confidence, accuracy, count = self.calibration_curve()
+        if count.sum() == 0:
+            return float("nan")
+        return float(np.sum(count * np.abs(mean_confidence - accuracy)) / count.sum())
+
+    def summary(self):
+        """Return the headline metrics as a plain dict"""
+        return {
+            "n_samples": self.n_samples,
+            "accuracy": self.accuracy(),
+            "roc_auc": self.roc_auc(),
+            "recall": self.recall_per_class(),
+            "expected_calibration_error": self.expected_calibration_error(),
+            "confusion_matrix": self.confusion.tolist(),
+        }
+
+    @staticmethod
+    def _bin_index(values, n_bins):
+        return np.clip((values * n_bins).astype(np.int64), 0, n_bins - 1)
+
+
+def evaluate_scored_file(path, chunksize=100_000, label_col="label",
+                         prediction_col="prediction", confidence_col="confidence",
+                         n_bins=100, n_calibration_bins=10):
+    """
+    Evaluate a scored CSV file chunk by chunk without loading it into memory
+
+    Args:
+        path (str): CSV with label, prediction and confidence columns
+        chunksize (int): Rows read per chunk
+
+    Returns:
+        StreamingEvaluator: The evaluator holding the accumulated metrics
+    """
+    evaluator = StreamingEvaluator(n_bins=n_bins, n_calibration_bins=n_calibration_bins)
+    columns = [label_col, prediction_col, confidence_col]
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+        evaluator.update(chunk[label_col].to_numpy(),
+                         chunk[prediction_col].to_numpy(),
+                         chunk[confidence_col].to_numpy())
+    return evaluator
+
+
+def _evaluate_shard(args):
+    path, kwargs = args
+    return evaluate_scored_file(path, **kwargs)
+
+
+def evaluate_scored_files(paths, n_jobs=None, **kwargs):
+    """
+    Evaluate several scored shards in parallel processes and merge the results
+
+    Args:
+        paths (list): Scored CSV files, one per shard
+        n_jobs (int): Worker processes, defaults to the CPU count
+
+    Returns:
+        StreamingEvaluator: The merged evaluator
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    paths = list(paths)
+    if not paths:
+        return StreamingEvaluator(n_bins=kwargs.get("n_bins", 100),
+                                  n_calibration_bins=kwargs.get("n_calibration_bins", 10))
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        shards = list(executor.map(_evaluate_shard, [(path, kwargs) for path in paths]))
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    return merged
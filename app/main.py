@@ -1,7 +1,9 @@
 import sys
 import os
+import time
 import numpy as np
 import random
+from contextlib import contextmanager
 from PyQt6.QtWidgets import (QWidget, QApplication, QPushButton, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QTextEdit, 
                              QGroupBox, QGridLayout, QMessageBox, QFrame,
@@ -9,6 +11,9 @@ from PyQt6.QtWidgets import (QWidget, QApplication, QPushButton, QVBoxLayout,
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtProperty, QRect
 from PyQt6.QtGui import QFont, QPalette, QColor, QLinearGradient, QPainter, QBrush
 from model import BreastCancerPredictor
+from audit_log import AuditLog
+from database import DatabaseWriter
+from worklist import WorklistWindow
 
 class AnimatedButton(QPushButton):
     def __init__(self, text, parent=None):
@@ -16,19 +21,80 @@ class AnimatedButton(QPushButton):
         self.setMinimumHeight(50)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
+class StartupProfiler:
+    """Record wall-clock milliseconds spent in each UI construction phase"""
+
+    def __init__(self):
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def report(self):
+        lines = ["Startup profile:"]
+        for name, ms in self.phases:
+            lines.append(f"  {name:<20} {ms:8.2f} ms")
+        lines.append(f"  {'total':<20} {sum(ms for _, ms in self.phases):8.2f} ms")
+        return "\n".join(lines)
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
-        self.predictor = BreastCancerPredictor()
+        self.profiler = StartupProfiler()
+        self._layout_key = None
+        self.worklist = None
+        with self.profiler.phase("model"):
+            self.predictor = BreastCancerPredictor()
+        with self.profiler.phase("storage"):
+            try:
+                self.predictor.audit_log = AuditLog("prediction_audit.log")
+            except Exception as e:
+                print(f"Audit log unavailable, predictions will not be audited: {e}")
+                self.predictor.audit_log = None
+            try:
+                self.db_writer = DatabaseWriter("patients.db")
+            except Exception as e:
+                print(f"Patient database unavailable, predictions will not be stored: {e}")
+                self.db_writer = None
         self.init_ui()
         
+    def closeEvent(self, event):
+        # The worklist waits for its scoring threads, which still use the
+        # shadow scorer and audit log, so it has to close first
+        if self.worklist is not None:
+            self.worklist.close()
+        # Write any queued audit records before the window goes away
+        if self.predictor.audit_log is not None:
+            self.predictor.audit_log.close()
+        self.predictor.disable_shadow()
+        if self.db_writer is not None:
+            self.db_writer.close()
+        super().closeEvent(event)
+        
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._layout_key is None:
+            with self.profiler.phase("first layout"):
+                self.apply_responsive_layout()
+        else:
+            self.apply_responsive_layout()
+        
     def init_ui(self):
         self.setWindowTitle("SVM Classifier for Breast Cancer Prediction")
         
         # Set larger window size to accommodate non-scrollable text
         self.setGeometry(100, 100, 1500, 1000)
         self.setMinimumSize(1300, 900)
-        self.setStyleSheet(self.get_modern_stylesheet())
+        
+        # All widget styling lives in this one sheet; widgets are matched by
+        # object name and the dynamic "state" property
+        with self.profiler.phase("stylesheet"):
+            self.setStyleSheet(self.get_modern_stylesheet())
         
         # Main layout
         main_layout = QVBoxLayout()
@@ -36,8 +102,9 @@ class MainWindow(QWidget):
         main_layout.setSpacing(0)
         
         # Header
-        header = self.create_modern_header()
-        main_layout.addWidget(header)
+        with self.profiler.phase("header"):
+            header = self.create_modern_header()
+            main_layout.addWidget(header)
         
         # Content area
         content_widget = QWidget()
@@ -46,46 +113,92 @@ class MainWindow(QWidget):
         content_layout.setSpacing(20)
         
         # Input panel
-        input_scroll = self.create_scrollable_input_panel()
-        content_layout.addWidget(input_scroll, 3)
+        with self.profiler.phase("input panel"):
+            input_scroll = self.create_scrollable_input_panel()
+            content_layout.addWidget(input_scroll, 3)
         
         # Results panel - give more space for text
-        results_panel = self.create_modern_results_panel()
-        content_layout.addWidget(results_panel, 2)
+        with self.profiler.phase("results panel"):
+            results_panel = self.create_modern_results_panel()
+            content_layout.addWidget(results_panel, 2)
         
         main_layout.addWidget(content_widget, 1)
         
         # Footer
-        footer = self.create_modern_footer()
-        main_layout.addWidget(footer)
+        with self.profiler.phase("footer"):
+            footer = self.create_modern_footer()
+            main_layout.addWidget(footer)
         
         self.setLayout(main_layout)
         
+    def apply_responsive_layout(self):
+        """Recompute every size that depends on the window dimensions"""
+        width, height = self.width(), self.height()
+        
+        group_padding = max(12, int(width * 0.012))
+        grid_spacing = max(6, int(width * 0.006))
+        cols = 3 if width > 1400 else 2
+        inner_padding = max(6, int(width * 0.005))
+        label_size = max(8, min(11, int(width * 0.007)))
+        input_size = max(9, min(12, int(width * 0.008)))
+        input_height = max(28, int(height * 0.035))
+        panel_padding = max(15, int(width * 0.015))
+        card_height = max(80, int(height * 0.12))
+        info_size = max(9, min(12, int(width * 0.008)))
+        seed_width = max(60, int(width * 0.06))
+        
+        key = (group_padding, grid_spacing, cols, inner_padding, label_size, input_size,
+               input_height, panel_padding, card_height, info_size, seed_width)
+        if key == self._layout_key:
+            return
+        self._layout_key = key
+        
+        label_font = QFont("Segoe UI", label_size, QFont.Weight.Normal)
+        input_font = QFont("Segoe UI", input_size, QFont.Weight.Normal)
+        
+        for group_layout, grid_layout, containers in self.feature_groups:
+            group_layout.setContentsMargins(group_padding, group_padding, group_padding, group_padding + 5)
+            group_layout.setSpacing(group_padding)
+            grid_layout.setSpacing(grid_spacing)
+            for i, (container, label, input_field) in enumerate(containers):
+                grid_layout.addWidget(container, i // cols, i % cols)
+                container.layout().setContentsMargins(inner_padding, inner_padding, inner_padding, inner_padding)
+                label.setFont(label_font)
+                input_field.setFont(input_font)
+                # Content height plus the vertical padding and border from the sheet
+                input_field.setMinimumHeight(input_height + 18)
+                
+        self.results_layout.setContentsMargins(panel_padding, panel_padding, panel_padding, panel_padding)
+        self.results_layout.setSpacing(panel_padding)
+        self.result_card.setMinimumHeight(card_height)
+        self.result_card.layout().setContentsMargins(panel_padding, panel_padding//2, panel_padding, panel_padding//2)
+        self.info_text.setFont(QFont("Segoe UI", info_size, QFont.Weight.Light))
+        self.seed_input.setMaximumWidth(seed_width)
+        
+    def set_state(self, widget, state):
+        """Switch a widget's "state" property and re-polish it against the app sheet"""
+        widget.setProperty("state", state)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+        
     def create_modern_header(self):
         header = QFrame()
+        header.setObjectName("header")
         header.setFixedHeight(90)
         
-        header.setStyleSheet("""
-            QFrame {
-                background: #1a1a1a;
-                border: none;
-                border-bottom: 1px solid #333333;
-            }
-        """)
-        
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 10, 20, 10)
         layout.setSpacing(3)
         
         title = QLabel("SVM Classifier for Cancer Prediction")
+        title.setObjectName("headerTitle")
         title.setFont(QFont("Segoe UI", 16, QFont.Weight.Normal))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("color: #ffffff; background: transparent;")
         
         subtitle = QLabel("AI Medical Analysis")
+        subtitle.setObjectName("headerSubtitle")
         subtitle.setFont(QFont("Segoe UI", 10, QFont.Weight.Light))
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("color: #888888; background: transparent;")
         
         layout.addWidget(title)
         layout.addWidget(subtitle)
@@ -95,28 +208,10 @@ class MainWindow(QWidget):
         
     def create_scrollable_input_panel(self):
         scroll_area = QScrollArea()
+        scroll_area.setObjectName("inputScroll")
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #1a1a1a;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #444444;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #555555;
-            }
-        """)
         
         content_widget = QWidget()
         main_layout = QVBoxLayout(content_widget)
@@ -149,6 +244,8 @@ class MainWindow(QWidget):
         ]
         
         self.feature_inputs = {}
+        # (group layout, grid layout, [(container, label, input)]) for the resize pass
+        self.feature_groups = []
         
         for group_title, features in feature_groups:
             group = self.create_feature_group(group_title, features)
@@ -159,183 +256,88 @@ class MainWindow(QWidget):
         
     def create_feature_group(self, title, features):
         group = QFrame()
-        group.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e1e1e, stop:1 #181818);
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-            }
-        """)
+        group.setObjectName("panel")
         
+        # Margins, spacing, columns and fonts are set by apply_responsive_layout
         layout = QVBoxLayout(group)
         
-        # Responsive padding
-        padding = max(12, int(self.width() * 0.012))
-        layout.setContentsMargins(padding, padding, padding, padding + 5)
-        layout.setSpacing(padding)
-        
         # Simple group title
         title_clean = title.split(' ', 1)[1] if ' ' in title else title
         title_label = QLabel(title_clean)
+        title_label.setObjectName("groupTitle")
         title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Medium))
-        title_label.setStyleSheet("color: #ffffff; background: transparent; border: none; margin-bottom: 8px;")
         layout.addWidget(title_label)
         
-        # Features grid with responsive columns
         grid_layout = QGridLayout()
+        containers = []
         
-        # Responsive spacing and columns
-        spacing = max(6, int(self.width() * 0.006))
-        grid_layout.setSpacing(spacing)
-        
-        # Determine columns based on window width
-        cols = 3 if self.width() > 1400 else 2
-        
-        for i, (display_name, field_name) in enumerate(features):
-            row = i // cols
-            col = i % cols
-            
+        for display_name, field_name in features:
             # Glassmorphism container
             container = QFrame()
-            container.setStyleSheet("""
-                QFrame {
-                    background: rgba(255, 255, 255, 0.03);
-                    border-radius: 8px;
-                    border: 1px solid rgba(255, 255, 255, 0.06);
-                    backdrop-filter: blur(10px);
-                }
-                QFrame:hover {
-                    background: rgba(255, 255, 255, 0.05);
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                }
-            """)
+            container.setObjectName("featureContainer")
             
             container_layout = QVBoxLayout(container)
-            inner_padding = max(6, int(self.width() * 0.005))
-            container_layout.setContentsMargins(inner_padding, inner_padding, inner_padding, inner_padding)
             container_layout.setSpacing(4)
             
-            # Responsive label
             label = QLabel(display_name)
-            label_size = max(8, min(11, int(self.width() * 0.007)))
-            label.setFont(QFont("Segoe UI", label_size, QFont.Weight.Normal))
-            label.setStyleSheet("""
-                color: rgba(255, 255, 255, 0.8); 
-                background: transparent; 
-                border: none;
-                letter-spacing: 0.5px;
-            """)
+            label.setObjectName("featureLabel")
             
             # Premium input field
             input_field = QLineEdit()
+            input_field.setObjectName("featureInput")
             input_field.setPlaceholderText("0.00")
             
-            input_size = max(9, min(12, int(self.width() * 0.008)))
-            input_field.setFont(QFont("Segoe UI", input_size, QFont.Weight.Normal))
-            
-            # Responsive input height
-            input_height = max(28, int(self.height() * 0.035))
-            
-            input_field.setStyleSheet(f"""
-                QLineEdit {{
-                    padding: 8px 12px;
-                    border: 1px solid rgba(255, 255, 255, 0.15);
-                    border-radius: 6px;
-                    background: rgba(0, 0, 0, 0.3);
-                    color: #ffffff;
-                    font-weight: 400;
-                    min-height: {input_height}px;
-                    selection-background-color: rgba(255, 255, 255, 0.2);
-                }}
-                QLineEdit:focus {{
-                    border: 2px solid rgba(255, 255, 255, 0.4);
-                    background: rgba(0, 0, 0, 0.5);
-                    box-shadow: 0 0 10px rgba(255, 255, 255, 0.1);
-                }}
-                QLineEdit:hover {{
-                    border: 1px solid rgba(255, 255, 255, 0.25);
-                    background: rgba(0, 0, 0, 0.4);
-                }}
-            """)
-            
             self.feature_inputs[field_name] = input_field
             
             container_layout.addWidget(label)
             container_layout.addWidget(input_field)
-            
-            grid_layout.addWidget(container, row, col)
+            containers.append((container, label, input_field))
             
         layout.addLayout(grid_layout)
+        self.feature_groups.append((layout, grid_layout, containers))
         return group
         
     def create_modern_results_panel(self):
         panel = QFrame()
-        panel.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e1e1e, stop:1 #181818);
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
-            }
-        """)
+        panel.setObjectName("panel")
         
         layout = QVBoxLayout(panel)
-        
-        # Responsive padding
-        padding = max(15, int(self.width() * 0.015))
-        layout.setContentsMargins(padding, padding, padding, padding)
-        layout.setSpacing(padding)
+        self.results_layout = layout
         
         # Simple title
         title = QLabel("Results")
+        title.setObjectName("resultsTitle")
         title.setFont(QFont("Segoe UI", 14, QFont.Weight.Medium))
-        title.setStyleSheet("color: #ffffff; background: transparent; border: none;")
         layout.addWidget(title)
         
         # Result card with premium styling
-        result_card = QFrame()
-        
-        # Responsive result card height
-        card_height = max(80, int(self.height() * 0.12))
-        result_card.setMinimumHeight(card_height)
-        
-        result_card.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.03);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                backdrop-filter: blur(20px);
-            }
-        """)
+        self.result_card = QFrame()
+        self.result_card.setObjectName("resultCard")
+        self.result_card.setProperty("state", "ready")
         
-        result_layout = QVBoxLayout(result_card)
-        result_layout.setContentsMargins(padding, padding//2, padding, padding//2)
+        result_layout = QVBoxLayout(self.result_card)
         result_layout.setSpacing(6)
         
-        # Responsive result text
-        result_size = max(16, min(24, int(self.width() * 0.016)))
-        confidence_size = max(10, min(14, int(self.width() * 0.009)))
-        
         self.result_label = QLabel("Ready")
+        self.result_label.setObjectName("resultLabel")
+        self.result_label.setProperty("state", "ready")
         self.result_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Light))
         self.result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.result_label.setStyleSheet("color: #aaaaaa; background: transparent; border: none;")
         
         self.confidence_label = QLabel("Awaiting input")
+        self.confidence_label.setObjectName("confidenceLabel")
+        self.confidence_label.setProperty("state", "ready")
         self.confidence_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Light))
         self.confidence_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.confidence_label.setStyleSheet("color: #777777; background: transparent; border: none;")
         
         result_layout.addWidget(self.result_label)
         result_layout.addWidget(self.confidence_label)
         
-        layout.addWidget(result_card)
+        layout.addWidget(self.result_card)
         
         # Info section with glassmorphism - non-scrollable
         self.info_text = QTextEdit()
+        self.info_text.setObjectName("infoText")
         self.info_text.setReadOnly(True)
         
         # Remove scroll bars to make it non-scrollable
@@ -345,19 +347,6 @@ class MainWindow(QWidget):
         # Set word wrap and adjust height to fit content
         self.info_text.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
         
-        info_size = max(9, min(12, int(self.width() * 0.008)))
-        self.info_text.setFont(QFont("Segoe UI", info_size, QFont.Weight.Light))
-        
-        self.info_text.setStyleSheet("""
-            QTextEdit {
-                background: rgba(255, 255, 255, 0.02);
-                border: 1px solid rgba(255, 255, 255, 0.06);
-                border-radius: 8px;
-                padding: 12px;
-                color: rgba(255, 255, 255, 0.8);
-                selection-background-color: rgba(255, 255, 255, 0.2);
-            }
-        """)
         self.info_text.setPlainText("Enter patient measurements and click Analyze for AI-powered diagnosis.\n\nUse Generate for random test data or Sample for known case.")
         
         layout.addWidget(self.info_text)
@@ -369,79 +358,35 @@ class MainWindow(QWidget):
         
     def create_modern_footer(self):
         footer = QFrame()
+        footer.setObjectName("footer")
         footer.setFixedHeight(80)
         
-        footer.setStyleSheet("""
-            QFrame {
-                background: #1a1a1a;
-                border-top: 1px solid #333333;
-            }
-        """)
-        
         layout = QHBoxLayout(footer)
         layout.setContentsMargins(20, 15, 20, 15)
         layout.setSpacing(15)
         
         # Seed container with glassmorphism
         seed_container = QFrame()
-        seed_container.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 4px;
-            }
-        """)
+        seed_container.setObjectName("seedContainer")
         
         seed_layout = QHBoxLayout(seed_container)
         seed_layout.setContentsMargins(8, 4, 8, 4)
         seed_layout.setSpacing(12)
         seed_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
         
-        # Responsive seed controls
-        font_size = max(9, min(12, int(self.width() * 0.008)))
-        
         seed_label = QLabel("Seed")
+        seed_label.setObjectName("seedLabel")
         seed_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Normal))
-        seed_label.setStyleSheet("color: #aaaaaa; background: transparent;")
         
         self.seed_input = QLineEdit()
+        self.seed_input.setObjectName("seedInput")
         self.seed_input.setPlaceholderText("12345")
-        
-        # Responsive seed input width
-        seed_width = max(60, int(self.width() * 0.06))
-        self.seed_input.setMaximumWidth(seed_width)
         self.seed_input.setFont(QFont("Segoe UI", 9))
-        self.seed_input.setStyleSheet("""
-            QLineEdit {
-                padding: 6px 8px;
-                border: 1px solid #333333;
-                border-radius: 3px;
-                background: #222222;
-                color: #ffffff;
-                min-height: 24px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #555555;
-            }
-        """)
         
         # Premium buttons with consistent styling
         self.generate_btn = AnimatedButton("Generate")
+        self.generate_btn.setObjectName("generateButton")
         self.generate_btn.setFont(QFont("Segoe UI", 10, QFont.Weight.Normal))
-        self.generate_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                min-height:16px;
-            }
-            QPushButton:hover {
-                background: #444444;
-            }
-        """)
         self.generate_btn.clicked.connect(self.generate_random_data)
         
         seed_layout.addWidget(seed_label)
@@ -450,77 +395,29 @@ class MainWindow(QWidget):
         
         # Simple action buttons
         self.sample_malignant_btn = AnimatedButton("Benign")
+        self.sample_malignant_btn.setObjectName("secondaryButton")
         self.sample_malignant_btn.setFont(QFont("Segoe UI", 10, QFont.Weight.Normal))
-        self.sample_malignant_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                min-height: 32px;
-            }
-            QPushButton:hover {
-                background: #444444;
-            }
-        """)
         self.sample_malignant_btn.clicked.connect(self.load_sample_malignant)
         
         self.sample_benign_btn = AnimatedButton("Malignant")
+        self.sample_benign_btn.setObjectName("secondaryButton")
         self.sample_benign_btn.setFont(QFont("Segoe UI", 10, QFont.Weight.Normal))
-        self.sample_benign_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                min-height: 32px;
-            }
-            QPushButton:hover {
-                background: #444444;
-            }
-        """)
         self.sample_benign_btn.clicked.connect(self.load_sample_benign)
         
         self.clear_btn = AnimatedButton("Clear")
+        self.clear_btn.setObjectName("secondaryButton")
         self.clear_btn.setFont(QFont("Segoe UI", 10, QFont.Weight.Normal))
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                min-height: 32px;
-            }
-            QPushButton:hover {
-                background: #444444;
-            }
-        """)
         self.clear_btn.clicked.connect(self.clear_inputs)
         
+        self.worklist_btn = AnimatedButton("Worklist")
+        self.worklist_btn.setObjectName("secondaryButton")
+        self.worklist_btn.setFont(QFont("Segoe UI", 10, QFont.Weight.Normal))
+        self.worklist_btn.clicked.connect(self.open_worklist)
+        
         # Primary analyze button
         self.predict_btn = AnimatedButton("Analyze")
+        self.predict_btn.setObjectName("primaryButton")
         self.predict_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        self.predict_btn.setStyleSheet("""
-            QPushButton {
-                background: #ffffff;
-                color: #000000;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 10px;
-                font-weight: 600;
-                min-width: 72px;
-                min-height: 28px;
-            }
-            QPushButton:hover {
-                background: #f0f0f0;
-            }
-            QPushButton:pressed {
-                background: #e0e0e0;
-            }
-        """)
         self.predict_btn.clicked.connect(self.predict_diagnosis)
         
         layout.addWidget(seed_container)
@@ -535,6 +432,7 @@ class MainWindow(QWidget):
         
         button_layout.addWidget(self.sample_malignant_btn)
         button_layout.addWidget(self.sample_benign_btn)
+        button_layout.addWidget(self.worklist_btn)
         button_layout.addWidget(self.clear_btn)
         button_layout.addWidget(self.predict_btn)
         
@@ -601,6 +499,247 @@ class MainWindow(QWidget):
             QScrollArea QScrollBar::sub-line:vertical {
                 height: 0px;
             }
+            
+            /* Header and footer */
+            QFrame#header {
+                background: #1a1a1a;
+                border: none;
+                border-bottom: 1px solid #333333;
+            }
+            
+            QLabel#headerTitle {
+                color: #ffffff;
+                background: transparent;
+            }
+            
+            QLabel#headerSubtitle {
+                color: #888888;
+                background: transparent;
+            }
+            
+            QFrame#footer {
+                background: #1a1a1a;
+                border-top: 1px solid #333333;
+            }
+            
+            QFrame#seedContainer {
+                background: rgba(255, 255, 255, 0.05);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+                border-radius: 8px;
+                padding: 4px;
+            }
+            
+            QLabel#seedLabel {
+                color: #aaaaaa;
+                background: transparent;
+                border: none;
+            }
+            
+            QLineEdit#seedInput {
+                padding: 6px 8px;
+                border: 1px solid #333333;
+                border-radius: 3px;
+                background: #222222;
+                color: #ffffff;
+                min-height: 24px;
+            }
+            
+            QLineEdit#seedInput:focus {
+                border: 1px solid #555555;
+            }
+            
+            QPushButton#generateButton, QPushButton#secondaryButton {
+                background: #333333;
+                color: #ffffff;
+                border: none;
+                border-radius: 4px;
+                padding: 8px 16px;
+                min-height: 32px;
+            }
+            
+            QPushButton#generateButton {
+                min-height: 16px;
+            }
+            
+            QPushButton#generateButton:hover, QPushButton#secondaryButton:hover {
+                background: #444444;
+            }
+            
+            QPushButton#primaryButton {
+                background: #ffffff;
+                color: #000000;
+                border: none;
+                border-radius: 4px;
+                padding: 10px 10px;
+                font-weight: 600;
+                min-width: 72px;
+                min-height: 28px;
+            }
+            
+            QPushButton#primaryButton:hover {
+                background: #f0f0f0;
+            }
+            
+            QPushButton#primaryButton:pressed {
+                background: #e0e0e0;
+            }
+            
+            /* Input panel */
+            QScrollArea#inputScroll {
+                border: none;
+                background: transparent;
+            }
+            
+            QScrollArea#inputScroll QScrollBar:vertical {
+                background: #1a1a1a;
+                width: 8px;
+                border-radius: 4px;
+            }
+            
+            QScrollArea#inputScroll QScrollBar::handle:vertical {
+                background: #444444;
+                border-radius: 4px;
+                min-height: 20px;
+            }
+            
+            QScrollArea#inputScroll QScrollBar::handle:vertical:hover {
+                background: #555555;
+            }
+            
+            QFrame#panel {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #1e1e1e, stop:1 #181818);
+                border-radius: 12px;
+                border: 1px solid rgba(255, 255, 255, 0.08);
+            }
+            
+            QLabel#groupTitle {
+                color: #ffffff;
+                background: transparent;
+                border: none;
+                margin-bottom: 8px;
+            }
+            
+            QFrame#featureContainer {
+                background: rgba(255, 255, 255, 0.03);
+                border-radius: 8px;
+                border: 1px solid rgba(255, 255, 255, 0.06);
+            }
+            
+            QFrame#featureContainer:hover {
+                background: rgba(255, 255, 255, 0.05);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+            }
+            
+            QLabel#featureLabel {
+                color: rgba(255, 255, 255, 0.8);
+                background: transparent;
+                border: none;
+                letter-spacing: 0.5px;
+            }
+            
+            QLineEdit#featureInput {
+                padding: 8px 12px;
+                border: 1px solid rgba(255, 255, 255, 0.15);
+                border-radius: 6px;
+                background: rgba(0, 0, 0, 0.3);
+                color: #ffffff;
+                font-weight: 400;
+                selection-background-color: rgba(255, 255, 255, 0.2);
+            }
+            
+            QLineEdit#featureInput:focus {
+                border: 2px solid rgba(255, 255, 255, 0.4);
+                background: rgba(0, 0, 0, 0.5);
+            }
+            
+            QLineEdit#featureInput:hover {
+                border: 1px solid rgba(255, 255, 255, 0.25);
+                background: rgba(0, 0, 0, 0.4);
+            }
+            
+            /* Results panel; result widgets switch on the "state" property */
+            QLabel#resultsTitle {
+                color: #ffffff;
+                background: transparent;
+                border: none;
+            }
+            
+            QFrame#resultCard {
+                background: rgba(255, 255, 255, 0.03);
+                border-radius: 10px;
+                border: 1px solid rgba(255, 255, 255, 0.1);
+            }
+            
+            QFrame#resultCard[state="malignant"] {
+                background: rgba(255, 107, 107, 0.05);
+                border: 1px solid rgba(255, 107, 107, 0.2);
+            }
+            
+            QFrame#resultCard[state="benign"] {
+                background: rgba(81, 207, 102, 0.05);
+                border: 1px solid rgba(81, 207, 102, 0.2);
+            }
+            
+            QLabel#resultLabel {
+                color: #aaaaaa;
+                background: transparent;
+                border: none;
+                font-weight: 300;
+            }
+            
+            QLabel#resultLabel[state="malignant"] {
+                color: #ff6b6b;
+                background: rgba(255, 107, 107, 0.1);
+                border: 1px solid rgba(255, 107, 107, 0.3);
+                border-radius: 6px;
+                font-weight: 400;
+            }
+            
+            QLabel#resultLabel[state="benign"] {
+                color: #51cf66;
+                background: rgba(81, 207, 102, 0.1);
+                border: 1px solid rgba(81, 207, 102, 0.3);
+                border-radius: 6px;
+                font-weight: 400;
+            }
+            
+            QLabel#confidenceLabel {
+                color: #777777;
+                background: transparent;
+                border: none;
+                font-weight: 300;
+            }
+            
+            QLabel#confidenceLabel[state="result"] {
+                color: #cccccc;
+                font-weight: 400;
+            }
+            
+            QTableView {
+                background: #141414;
+                alternate-background-color: #1a1a1a;
+                gridline-color: #2a2a2a;
+                border: 1px solid rgba(255, 255, 255, 0.08);
+                selection-background-color: rgba(255, 255, 255, 0.15);
+            }
+            
+            QHeaderView::section {
+                background: #1e1e1e;
+                color: #aaaaaa;
+                border: none;
+                border-right: 1px solid #2a2a2a;
+                padding: 4px 6px;
+            }
+            
+            QTextEdit#infoText {
+                background: rgba(255, 255, 255, 0.02);
+                border: 1px solid rgba(255, 255, 255, 0.06);
+                border-radius: 8px;
+                padding: 12px;
+                color: rgba(255, 255, 255, 0.8);
+                selection-background-color: rgba(255, 255, 255, 0.2);
+            }
         """
         
     def predict_diagnosis(self):
@@ -626,45 +765,24 @@ class MainWindow(QWidget):
                 
             # Make prediction
             prediction, confidence = self.predictor.predict(features)
+            if self.db_writer is not None:
+                self.db_writer.save_prediction(features, prediction, confidence,
+                                               model_version=self.predictor.model_version)
             
             # Update UI with clean styling
             if prediction == 1:
                 self.result_label.setText("Malignant")
-                self.result_label.setStyleSheet("""
-                    color: #ff6b6b;
-                    background: rgba(255, 107, 107, 0.1);
-                    border: 1px solid rgba(255, 107, 107, 0.3);
-                    border-radius: 6px;
-                    font-weight: 400;
-                """)
-                self.result_label.parent().setStyleSheet("""
-                    QFrame {
-                        background: rgba(255, 107, 107, 0.05);
-                        border-radius: 10px;
-                        border: 1px solid rgba(255, 107, 107, 0.2);
-                    }
-                """)
+                self.set_state(self.result_label, "malignant")
+                self.set_state(self.result_card, "malignant")
                 info_text = "CRITICAL: AI model predicts malignant case.\n\nImmediate medical consultation required.\nSchedule comprehensive diagnostic tests.\nSeek second medical opinion.\nEarly detection is crucial.\n\nPrediction based on machine learning analysis of cellular characteristics."
             else:
                 self.result_label.setText("Benign")
-                self.result_label.setStyleSheet("""
-                    color: #51cf66;
-                    background: rgba(81, 207, 102, 0.1);
-                    border: 1px solid rgba(81, 207, 102, 0.3);
-                    border-radius: 6px;
-                    font-weight: 400;
-                """)
-                self.result_label.parent().setStyleSheet("""
-                    QFrame {
-                        background: rgba(81, 207, 102, 0.05);
-                        border-radius: 10px;
-                        border: 1px solid rgba(81, 207, 102, 0.2);
-                    }
-                """)
+                self.set_state(self.result_label, "benign")
+                self.set_state(self.result_card, "benign")
                 info_text = "POSITIVE: AI model predicts benign case.\n\nContinue regular health screenings.\nMaintain healthy lifestyle habits.\nMonitor any symptom changes.\nFollow up with healthcare provider.\n\nPrediction indicates low cancer risk based on cellular analysis."
                 
             self.confidence_label.setText(f"Confidence: {confidence:.1%}")
-            self.confidence_label.setStyleSheet("color: #cccccc; font-weight: 400; background: transparent; border: none;")
+            self.set_state(self.confidence_label, "result")
             self.info_text.setPlainText(info_text)
             
         except Exception as e:
@@ -674,16 +792,10 @@ class MainWindow(QWidget):
         for input_field in self.feature_inputs.values():
             input_field.clear()
         self.result_label.setText("Ready")
-        self.result_label.setStyleSheet("color: #aaaaaa; background: transparent; border: none; font-weight: 300;")
-        self.result_label.parent().setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.03);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+        self.set_state(self.result_label, "ready")
+        self.set_state(self.result_card, "ready")
         self.confidence_label.setText("Awaiting input")
-        self.confidence_label.setStyleSheet("color: #777777; background: transparent; border: none; font-weight: 300;")
+        self.set_state(self.confidence_label, "ready")
         self.info_text.setPlainText("Enter patient measurements and click Analyze for AI-powered diagnosis.\n\nUse Generate for random test data or Sample for known case.")
         
     def generate_random_data(self):
@@ -804,15 +916,7 @@ class MainWindow(QWidget):
             # Fill the input fields with generated values
             for field_name, value in generated_values.items():
                 if field_name in self.feature_inputs:
-                    # Format to appropriate decimal places
-                    if value >= 100:
-                        formatted_value = f"{value:.1f}"
-                    elif value >= 1:
-                        formatted_value = f"{value:.3f}"
-                    else:
-                        formatted_value = f"{value:.5f}"
-                    
-                    self.feature_inputs[field_name].setText(formatted_value)
+                    self.feature_inputs[field_name].setText(self.format_feature_value(value))
             
             # Show success message - minimal
             QMessageBox.information(self, "Generated", 
@@ -821,6 +925,26 @@ class MainWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Generation Error", f"Error generating data: {str(e)}")
 
+    def format_feature_value(self, value):
+        # Format to appropriate decimal places
+        if value >= 100:
+            return f"{value:.1f}"
+        elif value >= 1:
+            return f"{value:.3f}"
+        return f"{value:.5f}"
+        
+    def fill_feature_inputs(self, values):
+        """Fill the detail form from 30 values in get_feature_names() order"""
+        for field_name, value in zip(self.predictor.get_feature_names(), values):
+            self.feature_inputs[field_name].setText(self.format_feature_value(value))
+            
+    def open_worklist(self):
+        if self.worklist is None:
+            self.worklist = WorklistWindow(self.predictor, self)
+            self.worklist.row_selected.connect(self.fill_feature_inputs)
+        self.worklist.show()
+        self.worklist.raise_()
+        
     def load_sample_malignant(self):
         # Sample data for testing (known malignant case with high confidence)
         sample_values = {
@@ -868,6 +992,11 @@ def main():
     window = MainWindow()
     window.show()
     
+    # Set BC_PROFILE_STARTUP=1 to print the time spent in each construction phase
+    if os.environ.get("BC_PROFILE_STARTUP"):
+        app.processEvents()
+        print(window.profiler.report())
+    
     sys.exit(app.exec())
 
 if __name__ == "__main__":
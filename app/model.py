@@ -1,15 +1,66 @@
 import joblib
+import hashlib
 import numpy as np
 import os
-from sklearn.svm import SVC
-from sklearn.preprocessing import StandardScaler
-from sklearn.datasets import load_breast_cancer
-from sklearn.model_selection import train_test_split
+from calibration import DecisionCalibrator
+
+FEATURE_NAMES = [
+    'mean_radius', 'mean_texture', 'mean_perimeter', 'mean_area',
+    'mean_smoothness', 'mean_compactness', 'mean_concavity',
+    'mean_concave_points', 'mean_symmetry', 'mean_fractal_dimension',
+    'se_radius', 'se_texture', 'se_perimeter', 'se_area',
+    'se_smoothness', 'se_compactness', 'se_concavity',
+    'se_concave_points', 'se_symmetry', 'se_fractal_dimension',
+    'worst_radius', 'worst_texture', 'worst_perimeter', 'worst_area',
+    'worst_smoothness', 'worst_compactness', 'worst_concavity',
+    'worst_concave_points', 'worst_symmetry', 'worst_fractal_dimension'
+]
+
+def file_version(path):
+    """Return a short content hash identifying a model file"""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+def load_calibrator(path, model, model_version):
+    """Load a calibrator if it belongs to the given model, else derive one from the model"""
+    if path and os.path.exists(path):
+        calibrator = joblib.load(path)
+        if getattr(calibrator, "model_version", None) == model_version:
+            return calibrator
+        print(f"{path} was fitted for a different model, ignoring it")
+    return DecisionCalibrator.from_svc(model)
+
+def score_decision(model, calibrator, features_scaled, return_decision=False):
+    """
+    Score already scaled rows from their decision values
+
+    Works for any saved SVC, with or without probability=True. The
+    confidence is the calibrated probability of the predicted class.
+
+    Returns:
+        tuple: (predictions, confidences) as NumPy arrays, plus the decision
+        values when return_decision is True
+    """
+    decision_values = model.decision_function(features_scaled)
+    predictions = model.classes_[(decision_values > 0).astype(int)]
+    positive_proba = calibrator.predict_proba(decision_values)
+    confidences = np.where(decision_values > 0, positive_proba, 1.0 - positive_proba)
+    if return_decision:
+        return predictions, confidences, decision_values
+    return predictions, confidences
 
 class BreastCancerPredictor:
     def __init__(self):
         self.model = None
         self.scaler = None
+        self.calibrator = None
+        self.model_version = ""
+        self.audit_log = None
+        self.shadow = None
+        self.drift_monitor = None
+        self.registry = None
+        # EarlyExitScorer for predict_bounded, rebuilt when the model changes
+        self._early_exit = None
         self.load_or_train_model()
         
     def load_or_train_model(self):
@@ -19,6 +70,8 @@ class BreastCancerPredictor:
             if os.path.exists("svm_model.pkl") and os.path.exists("scaler.pkl"):
                 self.model = joblib.load("svm_model.pkl")
                 self.scaler = joblib.load("scaler.pkl")
+                self.model_version = self.get_model_version("svm_model.pkl")
+                self.calibrator = self.load_calibrator()
                 print("Loaded existing SVM model and scaler")
             else:
                 print("Model files not found. Training new model...")
@@ -29,49 +82,34 @@ class BreastCancerPredictor:
             self.train_model()
             
     def train_model(self):
-        """Train a new SVM model using the breast cancer dataset"""
+        """Train a new SVM model with the cached training pipeline (see pipeline.py)"""
         try:
-            # Load the breast cancer dataset
-            data = load_breast_cancer()
-            X, y = data.data, data.target
-            
-            # Split the data
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42, stratify=y
-            )
+            from pipeline import TrainingPipeline
             
-            # Scale the features
-            self.scaler = StandardScaler()
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
+            # Prefer the project dataset; fall back to the scikit-learn copy
+            data_path = "model/data.csv" if os.path.exists("model/data.csv") else None
+            result = TrainingPipeline(data_path=data_path).run(output_dir=".")
             
-            # Train SVM model
-            self.model = SVC(kernel='rbf', C=1.0, gamma='scale', probability=True, random_state=42)
-            self.model.fit(X_train_scaled, y_train)
-            
-            # Evaluate the model
-            train_score = self.model.score(X_train_scaled, y_train)
-            test_score = self.model.score(X_test_scaled, y_test)
+            self.model = result["model"]
+            self.scaler = result["scaler"]
+            self.calibrator = result["calibrator"]
+            self.model_version = result["model_version"]
             
             print(f"Model trained successfully!")
-            print(f"Training accuracy: {train_score:.4f}")
-            print(f"Testing accuracy: {test_score:.4f}")
-            
-            # Save the model and scaler
-            joblib.dump(self.model, "svm_model.pkl")
-            joblib.dump(self.scaler, "scaler.pkl")
-            print("Model and scaler saved successfully!")
+            print(f"Training accuracy: {result['metrics']['train_accuracy']:.4f}")
+            print(f"Testing accuracy: {result['metrics']['accuracy']:.4f}")
             
         except Exception as e:
             print(f"Error training model: {e}")
             raise
             
-    def predict(self, features):
+    def predict(self, features, variant=None):
         """
         Make a prediction on the given features
         
         Args:
             features (list): List of 30 feature values
+            variant (str): Optional registry variant to use instead of the live model
             
         Returns:
             tuple: (prediction, confidence) where prediction is 0 (benign) or 1 (malignant)
@@ -85,28 +123,190 @@ class BreastCancerPredictor:
         # Convert to numpy array and reshape
         features_array = np.array(features).reshape(1, -1)
         
+        if variant is not None:
+            predictions, confidences, version = self.predict_variant(variant, features_array)
+            if self.audit_log is not None:
+                self.audit_log.record(features_array[0], predictions[0], confidences[0], version)
+            return predictions[0], confidences[0]
+        
         # Scale the features
         features_scaled = self.scaler.transform(features_array)
         
-        # Make prediction
-        prediction = self.model.predict(features_scaled)[0]
+        # Make prediction, with confidence derived from the decision value
+        predictions, confidences = self.score_scaled(features_scaled)
+        prediction, confidence = predictions[0], confidences[0]
+        
+        if self.drift_monitor is not None:
+            self.drift_monitor.update(features_scaled[0])
         
-        # Get prediction probabilities for confidence
-        probabilities = self.model.predict_proba(features_scaled)[0]
-        confidence = max(probabilities)
+        if self.audit_log is not None:
+            self.audit_log.record(features_array[0], prediction, confidence, self.model_version)
+        
+        if self.shadow is not None:
+            self.shadow.submit(features_array, predictions, confidences)
         
         return prediction, confidence
+
+    def predict_batch(self, features, variant=None):
+        """
+        Make predictions for many rows in one call
+
+        Args:
+            features (array-like): Array of shape (n, 30)
+            variant (str): Optional registry variant to use instead of the live model
+
+        Returns:
+            tuple: (predictions, confidences) as NumPy arrays of length n
+        """
+        features_array = self._check_batch(features)
+        predictions, confidences, _ = self._score_rows(features_array, variant)
+        return predictions, confidences
+
+    def score_batch(self, features, row_ids=None, variant=None, chunk_rows=100000):
+        """
+        Score many rows into a columnar BatchResult
+
+        Rows are scored chunk by chunk so intermediate arrays stay bounded;
+        the result holds contiguous label, confidence, decision value and
+        row id arrays.
+
+        Args:
+            features (array-like): Array of shape (n, 30)
+            row_ids (array-like): Optional id per row, defaults to 0..n-1
+            variant (str): Optional registry variant to use instead of the live model
+        """
+        from results import BatchResult
+
+        features_array = self._check_batch(features)
+        n = len(features_array)
+        labels = np.empty(n, dtype=np.int8)
+        confidences = np.empty(n, dtype=np.float32)
+        decision_values = np.empty(n, dtype=np.float32)
+        for start in range(0, n, chunk_rows):
+            stop = min(start + chunk_rows, n)
+            (labels[start:stop], confidences[start:stop],
+             decision_values[start:stop]) = self._score_rows(features_array[start:stop], variant)
+        return BatchResult(labels, confidences, decision_values, row_ids)
+
+    def _check_batch(self, features):
+        if self.model is None or self.scaler is None:
+            raise ValueError("Model not loaded or trained")
+
+        features_array = np.asarray(features, dtype=np.float64)
+        if features_array.ndim != 2 or features_array.shape[1] != 30:
+            raise ValueError(f"Expected an array of shape (n, 30), got {features_array.shape}")
+        return features_array
+
+    def _score_rows(self, features_array, variant=None):
+        """Score a validated (n, 30) array, feeding the drift monitor and shadow model"""
+        if variant is not None:
+            return self.predict_variant(variant, features_array, return_decision=True)[:3]
+
+        features_scaled = self.scaler.transform(features_array)
+        predictions, confidences, decision_values = score_decision(
+            self.model, self.calibrator, features_scaled, return_decision=True
+        )
+
+        if self.drift_monitor is not None:
+            self.drift_monitor.update(features_scaled)
+
+        if self.shadow is not None:
+            self.shadow.submit(features_array, predictions, confidences)
+
+        return predictions, confidences, decision_values
+
+    def predict_bounded(self, features, block_size=8):
+        """
+        Exact labels with confidence intervals, stopping early per row once the
+        label is decided (RBF SVC models only, see EarlyExitScorer)
+
+        Args:
+            features (array-like): Array of shape (n, 30)
+
+        Returns:
+            tuple: (predictions, confidence_low, confidence_high, n_evaluated)
+        """
+        from early_exit import EarlyExitScorer
+
+        features_array = self._check_batch(features)
+        scorer = self._early_exit
+        if (scorer is None or scorer.model is not self.model or scorer.block_size != block_size
+                or scorer.calibrator is not self.calibrator):
+            scorer = EarlyExitScorer(self.model, self.calibrator, block_size=block_size)
+            self._early_exit = scorer
+        return scorer.predict(self.scaler.transform(features_array))
+
+    def use_registry(self, directory="models", memory_budget_mb=256):
+        """Serve the model variants stored under directory by name, see ModelRegistry"""
+        from registry import ModelRegistry
+
+        self.registry = ModelRegistry(directory, memory_budget_mb)
+        return self.registry.list_variants()
+
+    def predict_variant(self, variant, features_array, return_decision=False):
+        """
+        Score unscaled rows with a registry variant
+
+        Drift monitoring and shadow scoring only follow the live model.
+
+        Returns:
+            tuple: (predictions, confidences, model_version), or
+            (predictions, confidences, decision_values, model_version) when
+            return_decision is True
+        """
+        if self.registry is None:
+            raise ValueError("No model registry configured, call use_registry() first")
+        entry = self.registry.get(variant)
+        scores = score_decision(
+            entry.model, entry.calibrator, entry.scaler.transform(features_array),
+            return_decision=return_decision
+        )
+        return (*scores, entry.version)
+
+    def enable_shadow(self, model_path, scaler_path, calibrator_path=None, max_workers=1):
+        """
+        Score every request with a candidate model as well, without affecting results
+
+        Comparison statistics are available from self.shadow.summary().
+        """
+        from shadow import ShadowScorer
+
+        self.disable_shadow()
+        self.shadow = ShadowScorer(model_path, scaler_path, calibrator_path, max_workers=max_workers)
+        print(f"Shadow scoring enabled with candidate {self.shadow.model_version}")
+
+    def enable_drift_monitor(self, reference_data=None, **kwargs):
+        """
+        Compare every input against the training distribution stored in the scaler
+
+        Args:
+            reference_data (array-like): Optional unscaled training rows used
+                as the PSI baseline instead of a normal approximation
+            **kwargs: Thresholds passed to DriftMonitor
+        """
+        from drift import DriftMonitor
+
+        self.drift_monitor = DriftMonitor(FEATURE_NAMES, **kwargs)
+        if reference_data is not None:
+            self.drift_monitor.set_reference(self.scaler.transform(np.asarray(reference_data, dtype=np.float64)))
+
+    def disable_shadow(self):
+        if self.shadow is not None:
+            self.shadow.close()
+            self.shadow = None
+
+    def score_scaled(self, features_scaled):
+        """Score already scaled rows, see score_decision"""
+        return score_decision(self.model, self.calibrator, features_scaled)
+
+    def load_calibrator(self):
+        """Load calibrator.pkl if it belongs to the loaded model, else derive one from the SVC"""
+        return load_calibrator("calibrator.pkl", self.model, self.model_version)
+
+    def get_model_version(self, path):
+        """Return a short content hash identifying the model file"""
+        return file_version(path)
         
     def get_feature_names(self):
         """Return the names of the 30 features expected by the model"""
-        return [
-            'mean_radius', 'mean_texture', 'mean_perimeter', 'mean_area',
-            'mean_smoothness', 'mean_compactness', 'mean_concavity',
-            'mean_concave_points', 'mean_symmetry', 'mean_fractal_dimension',
-            'se_radius', 'se_texture', 'se_perimeter', 'se_area',
-            'se_smoothness', 'se_compactness', 'se_concavity',
-            'se_concave_points', 'se_symmetry', 'se_fractal_dimension',
-            'worst_radius', 'worst_texture', 'worst_perimeter', 'worst_area',
-            'worst_smoothness', 'worst_compactness', 'worst_concavity',
-            'worst_concave_points', 'worst_symmetry', 'worst_fractal_dimension'
-        ]
\ No newline at end of file
+        return list(FEATURE_NAMES)
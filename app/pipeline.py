@@ -0,0 +1,288 @@
+"""
+Scripted training pipeline with cached stages
+
+Stages: load -> split -> scale -> fit -> calibrate -> evaluate -> export,
+plus an optional plot stage. Every stage's output is cached under a hash of
+its own parameters and the hashes of its inputs, and the load stage is keyed
+by the content of the data file. Changing one hyperparameter therefore only
+re-runs the stages downstream of it; everything else comes from the cache.
+Stages that cache fitted estimators also key on the scikit-learn version,
+so an upgrade refits them instead of unpickling stale objects.
+
+    python app/pipeline.py --data model/data.csv --C 2.0 --output-dir .
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.datasets import load_breast_cancer
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from calibration import DecisionCalibrator
+from evaluation import StreamingEvaluator
+from model import FEATURE_NAMES, file_version, score_decision
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class TrainingPipeline:
+    """
+    Importable, headless replacement for the notebook and train_model
+
+    Args:
+        data_path (str): CSV in the model/data.csv layout, or None for the
+            scikit-learn copy of the same dataset
+        cache_dir (str): Where stage outputs are stored
+        plots_dir (str): If set, the notebook's feature scatter plots are
+            written there as PNGs by a background thread
+    """
+
+    def __init__(self, data_path="model/data.csv", cache_dir=".pipeline_cache",
+                 test_size=0.2, calibration_size=0.2, random_state=42,
+                 kernel="rbf", C=1.0, gamma="scale", calibration="sigmoid",
+                 plots_dir=None):
+        self.data_path = data_path
+        self.cache_dir = cache_dir
+        self.test_size = test_size
+        self.calibration_size = calibration_size
+        self.random_state = random_state
+        self.kernel = kernel
+        self.C = C
+        self.gamma = gamma
+        self.calibration = calibration
+        self.plots_dir = plots_dir
+        self.plot_thread = None
+        # (stage, key, cache hit, seconds) for the last run
+        self.log = []
+
+    def stage(self, name, params, inputs, func):
+        """
+        Run func(*input_values) unless a cached result exists
+
+        Args:
+            name (str): Stage name
+            params (dict): Parameters the stage depends on
+            inputs (list): (key, value) pairs returned by upstream stages
+
+        Returns:
+            tuple: (key, value) for this stage
+        """
+        spec = {"stage": name, "params": params, "inputs": [key for key, _ in inputs]}
+        key = hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()[:16]
+        path = os.path.join(self.cache_dir, f"{name}-{key}.joblib")
+
+        start = time.perf_counter()
+        if os.path.exists(path):
+            value = joblib.load(path)
+            hit = True
+        else:
+            value = func(*[value for _, value in inputs])
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename so an interrupted run never leaves a torn entry
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            joblib.dump(value, tmp_path)
+            os.replace(tmp_path, path)
+            hit = False
+        seconds = time.perf_counter() - start
+        self.log.append((name, key, hit, seconds))
+        print(f"{name:<10} {'cached' if hit else 'ran':<7} {seconds * 1000:8.1f} ms  [{key}]")
+        return key, value
+
+    def run(self, output_dir=None, plots=None):
+        """
+        Run all stages
+
+        Args:
+            output_dir (str): If set, write svm_model.pkl, scaler.pkl and
+                calibrator.pkl there for BreastCancerPredictor
+            plots (bool): Run the plot stage (defaults to plots_dir being set)
+
+        Returns:
+            dict: model, scaler, calibrator, metrics and model_version
+        """
+        self.log = []
+
+        if self.data_path is None:
+            source = {"source": "sklearn", "version": sklearn.__version__}
+        else:
+            source = {"source": "csv", "sha256": hash_file(self.data_path)}
+        data = self.stage("load", source, [], self._load)
+
+        split = self.stage("split", {
+            "test_size": self.test_size,
+            "calibration_size": self.calibration_size,
+            "random_state": self.random_state,
+        }, [data], self._split)
+
+        scaled = self.stage("scale", {"sklearn": sklearn.__version__}, [split], self._scale)
+
+        fitted = self.stage("fit", {
+            "kernel": self.kernel, "C": self.C, "gamma": self.gamma,
+            "random_state": self.random_state, "sklearn": sklearn.__version__,
+        }, [scaled], self._fit)
+
+        calibrated = self.stage("calibrate", {
+            "method": self.calibration, "fit_intercept": False, "sklearn": sklearn.__version__,
+        }, [scaled, fitted], self._calibrate)
+
+        _, metrics = self.stage("evaluate", {}, [scaled, fitted, calibrated], self._evaluate)
+
+        if plots is None:
+            plots = self.plots_dir is not None
+        if plots:
+            self.start_plots(data[1])
+
+        model = fitted[1]
+        scaler = scaled[1]["scaler"]
+        calibrator = calibrated[1]
+        model_version = None
+        if output_dir is not None:
+            model_version = self.export(output_dir, model, scaler, calibrator)
+
+        print(f"Testing accuracy: {metrics['accuracy']:.4f}, ROC AUC: {metrics['roc_auc']:.4f}")
+        return {
+            "model": model,
+            "scaler": scaler,
+            "calibrator": calibrator,
+            "metrics": metrics,
+            "model_version": model_version,
+        }
+
+    def _load(self):
+        if self.data_path is None:
+            data = load_breast_cancer()
+            # scikit-learn encodes malignant as 0; the app uses 1 for malignant
+            return {"X": data.data, "y": 1 - data.target}
+        df = pd.read_csv(self.data_path)
+        X = df.iloc[:, 2:32].to_numpy(dtype=np.float64)
+        y = df["diagnosis"].map({"M": 1, "B": 0}).to_numpy()
+        known = ~pd.isna(y)
+        return {"X": X[known], "y": y[known].astype(np.int64)}
+
+    def _split(self, data):
+        X_train, X_test, y_train, y_test = train_test_split(
+            data["X"], data["y"], test_size=self.test_size,
+            random_state=self.random_state, stratify=data["y"]
+        )
+        # Held out from the SVC so the calibrator sees unbiased decision values
+        X_fit, X_calib, y_fit, y_calib = train_test_split(
+            X_train, y_train, test_size=self.calibration_size,
+            random_state=self.random_state, stratify=y_train
+        )
+        return {"X_fit": X_fit, "y_fit": y_fit, "X_calib": X_calib, "y_calib": y_calib,
+                "X_test": X_test, "y_test": y_test}
+
+    def _scale(self, split):
+        scaler = StandardScaler()
+        return {
+            "scaler": scaler,
+            "X_fit": scaler.fit_transform(split["X_fit"]),
+            "X_calib": scaler.transform(split["X_calib"]),
+            "X_test": scaler.transform(split["X_test"]),
+            "y_fit": split["y_fit"],
+            "y_calib": split["y_calib"],
+            "y_test": split["y_test"],
+        }
+
+    def _fit(self, scaled):
+        model = SVC(kernel=self.kernel, C=self.C, gamma=self.gamma, random_state=self.random_state)
+        model.fit(scaled["X_fit"], scaled["y_fit"])
+        return model
+
+    def _calibrate(self, scaled, model):
+        calibrator = DecisionCalibrator(self.calibration)
+        calibrator.fit(model.decision_function(scaled["X_calib"]), scaled["y_calib"])
+        return calibrator
+
+    def _evaluate(self, scaled, model, calibrator):
+        predictions, confidences = score_decision(model, calibrator, scaled["X_test"])
+        evaluator = StreamingEvaluator()
+        evaluator.update(scaled["y_test"], predictions, confidences)
+        metrics = evaluator.summary()
+        metrics["train_accuracy"] = float(model.score(scaled["X_fit"], scaled["y_fit"]))
+        return metrics
+
+    def export(self, output_dir, model, scaler, calibrator):
+        """Write the artifacts BreastCancerPredictor loads and return the model hash"""
+        os.makedirs(output_dir, exist_ok=True)
+        model_path = os.path.join(output_dir, "svm_model.pkl")
+        joblib.dump(model, model_path)
+        joblib.dump(scaler, os.path.join(output_dir, "scaler.pkl"))
+        calibrator.model_version = file_version(model_path)
+        joblib.dump(calibrator, os.path.join(output_dir, "calibrator.pkl"))
+        print(f"Model, scaler and calibrator saved to {output_dir}")
+        return calibrator.model_version
+
+    def start_plots(self, data):
+        """Write one scatter plot per feature against the diagnosis without blocking"""
+        plots_dir = self.plots_dir or "plots"
+        self.plot_thread = threading.Thread(target=self._plot, args=(data, plots_dir),
+                                            name="pipeline-plots", daemon=True)
+        self.plot_thread.start()
+
+    def wait_for_plots(self):
+        if self.plot_thread is not None:
+            self.plot_thread.join()
+
+    def _plot(self, data, plots_dir):
+        try:
+            import matplotlib
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+        except ImportError:
+            print("matplotlib is not installed, skipping plots")
+            return
+        os.makedirs(plots_dir, exist_ok=True)
+        labels = np.where(data["y"] == 1, "M", "B")
+        for j, name in enumerate(FEATURE_NAMES):
+            fig, ax = plt.subplots(figsize=(4, 3))
+            ax.scatter(labels, data["X"][:, j], s=6, alpha=0.5)
+            ax.set_title(name)
+            fig.tight_layout()
+            fig.savefig(os.path.join(plots_dir, f"{name}.png"))
+            plt.close(fig)
+        print(f"Plots written to {plots_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the cached training pipeline")
+    parser.add_argument("--data", default="model/data.csv", help="CSV in the model/data.csv layout")
+    parser.add_argument("--cache-dir", default=".pipeline_cache")
+    parser.add_argument("--output-dir", default=None, help="Where to write the model artifacts")
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--calibration-size", type=float, default=0.2)
+    parser.add_argument("--random-state", type=int, default=42)
+    parser.add_argument("--kernel", default="rbf")
+    parser.add_argument("--C", type=float, default=1.0)
+    parser.add_argument("--gamma", default="scale")
+    parser.add_argument("--calibration", choices=["sigmoid", "isotonic"], default="sigmoid")
+    parser.add_argument("--plots-dir", default=None, help="Write feature scatter plots here")
+    args = parser.parse_args()
+
+    gamma = args.gamma if args.gamma in ("scale", "auto") else float(args.gamma)
+    pipeline = TrainingPipeline(
+        data_path=args.data, cache_dir=args.cache_dir, test_size=args.test_size,
+        calibration_size=args.calibration_size, random_state=args.random_state,
+        kernel=args.kernel, C=args.C, gamma=gamma, calibration=args.calibration,
+        plots_dir=args.plots_dir,
+    )
+    result = pipeline.run(output_dir=args.output_dir)
+    print(json.dumps(result["metrics"], indent=2))
+    pipeline.wait_for_plots()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import os
+import threading
+from collections import OrderedDict
+import joblib
+from model import file_version, load_calibrator
+
+MODEL_FILE = "svm_model.pkl"
+SCALER_FILE = "scaler.pkl"
+CALIBRATOR_FILE = "calibrator.pkl"
+
+
+class ModelVariant:
+    """A loaded model, scaler and calibrator triple from the registry"""
+
+    def __init__(self, name, path, model, scaler, calibrator, version, size_bytes):
+        self.name = name
+        self.path = path
+        self.model = model
+        self.scaler = scaler
+        self.calibrator = calibrator
+        self.version = version
+        self.size_bytes = size_bytes
+
+
+class ModelRegistry:
+    """
+    Directory of model variants loaded lazily and evicted LRU
+
+    Each variant is a subdirectory holding svm_model.pkl and scaler.pkl, plus
+    an optional calibrator.pkl, for example:
+
+        models/
+            svc-probability/   svm_model.pkl  scaler.pkl
+            svc-plain/         svm_model.pkl  scaler.pkl
+            sgd-rff@2/         svm_model.pkl  scaler.pkl  calibrator.pkl
+
+    Listing only looks at the directory. A variant is unpickled on its first
+    get(), and when the loaded variants exceed memory_budget_mb the least
+    recently used ones are dropped. Unpickling happens outside the registry
+    lock, so variants already in memory are served while another one loads;
+    concurrent requests for the same variant wait for a single load, and
+    loads of different variants wait until their combined size fits the
+    budget. Sizes are estimated from the artifact file sizes, which for
+    joblib pickles of NumPy arrays track memory closely.
+    """
+
+    def __init__(self, directory="models", memory_budget_mb=256):
+        self.directory = directory
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.loaded = OrderedDict()
+        self.loaded_bytes = 0
+        # Bytes of variants being unpickled, and one event per name being loaded
+        self.reserved_bytes = 0
+        self._loading = {}
+        self.loads = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # Signalled when a load releases its reserved bytes
+        self._room = threading.Condition(self._lock)
+
+    def list_variants(self):
+        """Return the names of all variants on disk, sorted"""
+        if not os.path.isdir(self.directory):
+            return []
+        names = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(os.path.join(path, MODEL_FILE)) and os.path.isfile(os.path.join(path, SCALER_FILE)):
+                names.append(name)
+        return sorted(names)
+
+    def artifact_size(self, name):
+        path = os.path.join(self.directory, name)
+        return sum(os.path.getsize(os.path.join(path, f))
+                   for f in (MODEL_FILE, SCALER_FILE, CALIBRATOR_FILE)
+                   if os.path.exists(os.path.join(path, f)))
+
+    def get(self, name):
+        """Return the loaded ModelVariant, loading it (and evicting others) if needed"""
+        while True:
+            with self._lock:
+                variant = self.loaded.get(name)
+                if variant is not None:
+                    self.loaded.move_to_end(name)
+                    return variant
+                loading = self._loading.get(name)
+                if loading is None:
+                    loading = self._loading[name] = threading.Event()
+                    break
+            # Another thread is loading this variant; use its result when done
+            loading.wait()
+
+        try:
+            return self._load(name)
+        finally:
+            with self._lock:
+                del self._loading[name]
+            loading.set()
+
+    def _load(self, name):
+        """Unpickle a variant without holding the lock, so cached variants stay available"""
+        path = os.path.join(self.directory, name)
+        if name not in self.list_variants():
+            raise KeyError(f"Unknown model variant: {name}")
+        size = self.artifact_size(name)
+        if size > self.memory_budget:
+            raise MemoryError(f"Model variant {name} ({size} bytes) exceeds the registry memory budget")
+        with self._lock:
+            # Make room before loading so the budget also holds during the load;
+            # if other loads alone leave too little, wait for them to finish
+            while self.loaded_bytes + self.reserved_bytes + size > self.memory_budget:
+                if self.loaded:
+                    self._evict_oldest()
+                else:
+                    self._room.wait()
+            self.reserved_bytes += size
+
+        try:
+            model = joblib.load(os.path.join(path, MODEL_FILE))
+            scaler = joblib.load(os.path.join(path, SCALER_FILE))
+            version = file_version(os.path.join(path, MODEL_FILE))
+            calibrator = load_calibrator(os.path.join(path, CALIBRATOR_FILE), model, version)
+            variant = ModelVariant(name, path, model, scaler, calibrator, version, size)
+        finally:
+            with self._lock:
+                self.reserved_bytes -= size
+                self._room.notify_all()
+
+        with self._lock:
+            while self.loaded and self.loaded_bytes + self.reserved_bytes + size > self.memory_budget:
+                self._evict_oldest()
+            self.loaded[name] = variant
+            self.loaded_bytes += size
+            self.loads += 1
+        print(f"Loaded model variant {name} ({version})")
+        return variant
+
+    def unload(self, name):
+        with self._lock:
+            variant = self.loaded.pop(name, None)
+            if variant is not None:
+                self.loaded_bytes -= variant.size_bytes
+
+    def _evict_oldest(self):
+        name, variant = self.loaded.popitem(last=False)
+        self.loaded_bytes -= variant.size_bytes
+        self.evictions += 1
+        print(f"Evicted model variant {name}")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "loaded": list(self.loaded),
+                "loaded_bytes": self.loaded_bytes,
+                "memory_budget": self.memory_budget,
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
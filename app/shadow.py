@@ -0,0 +1,190 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import joblib
+import numpy as np
+from model import file_version, load_calibrator, score_decision
+
+# Latency histogram: log-spaced bins from 10 microseconds to 10 seconds
+LATENCY_BIN_EDGES = np.logspace(-5, 1, 61)
+
+
+def malignant_probability(predictions, confidences):
+    """Convert predicted-class confidences to P(malignant) for 0/1 labels"""
+    confidences = np.asarray(confidences, dtype=np.float64).ravel()
+    return np.where(np.asarray(predictions).ravel() == 1, confidences, 1.0 - confidences)
+
+
+class ShadowStats:
+    """
+    Constant-memory comparison of a candidate model against the live model
+
+    Tracks the disagreement rate, running moments of the change in
+    P(malignant) (candidate minus live) and a fixed log-binned histogram of
+    candidate latency from which percentiles are estimated. Confidences are
+    for the predicted class, so both sides are first converted to
+    P(malignant); otherwise two confident models that disagree would show
+    no change at all.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.disagreements = 0
+        self.delta_mean = 0.0
+        self.delta_m2 = 0.0
+        self.delta_abs_sum = 0.0
+        self.delta_abs_max = 0.0
+        self.latency_hist = np.zeros(len(LATENCY_BIN_EDGES) + 1, dtype=np.int64)
+        self.latency_sum = 0.0
+        self.latency_calls = 0
+
+    def update(self, live_predictions, live_confidences, shadow_predictions, shadow_confidences, latency):
+        """Fold one scored request or batch into the running statistics"""
+        live_predictions = np.asarray(live_predictions).ravel()
+        shadow_predictions = np.asarray(shadow_predictions).ravel()
+        deltas = (malignant_probability(shadow_predictions, shadow_confidences)
+                  - malignant_probability(live_predictions, live_confidences))
+        n = len(deltas)
+        if n == 0:
+            return
+        self.disagreements += int(np.sum(live_predictions != shadow_predictions))
+
+        # Chan et al. parallel update of the running mean and M2
+        batch_mean = float(deltas.mean())
+        batch_m2 = float(((deltas - batch_mean) ** 2).sum())
+        total = self.count + n
+        diff = batch_mean - self.delta_mean
+        self.delta_mean += diff * n / total
+        self.delta_m2 += batch_m2 + diff * diff * self.count * n / total
+        self.count = total
+
+        abs_deltas = np.abs(deltas)
+        self.delta_abs_sum += float(abs_deltas.sum())
+        self.delta_abs_max = max(self.delta_abs_max, float(abs_deltas.max()))
+
+        self.latency_hist[np.searchsorted(LATENCY_BIN_EDGES, latency)] += 1
+        self.latency_sum += latency
+        self.latency_calls += 1
+
+    def latency_percentile(self, q):
+        """Approximate latency percentile in seconds (upper edge of the matching bin)"""
+        if self.latency_calls == 0:
+            return float("nan")
+        target = q / 100 * self.latency_calls
+        index = int(np.searchsorted(np.cumsum(self.latency_hist), target))
+        return float(LATENCY_BIN_EDGES[min(index, len(LATENCY_BIN_EDGES) - 1)])
+
+    def summary(self):
+        count = self.count
+        return {
+            "count": count,
+            "disagreements": self.disagreements,
+            "disagreement_rate": self.disagreements / count if count else float("nan"),
+            "malignant_probability_delta_mean": self.delta_mean if count else float("nan"),
+            "malignant_probability_delta_std": (self.delta_m2 / count) ** 0.5 if count else float("nan"),
+            "malignant_probability_delta_abs_mean": self.delta_abs_sum / count if count else float("nan"),
+            "malignant_probability_delta_abs_max": self.delta_abs_max,
+            "latency_calls": self.latency_calls,
+            "latency_mean_ms": 1000 * self.latency_sum / self.latency_calls if self.latency_calls else float("nan"),
+            "latency_p50_ms": 1000 * self.latency_percentile(50),
+            "latency_p99_ms": 1000 * self.latency_percentile(99),
+        }
+
+
+class ShadowScorer:
+    """
+    Score requests with a candidate model on a thread pool next to the live model
+
+    submit() returns immediately; the live result is never waited on or
+    modified. Queued jobs keep their input rows alive, so the backlog is
+    bounded by rows rather than jobs: a job that would take the queue past
+    max_pending_rows is skipped and counted in `skipped` and `skipped_rows`,
+    and a slow candidate cannot hold more than that many rows in memory.
+    """
+
+    def __init__(self, model_path, scaler_path, calibrator_path=None, max_workers=1,
+                 max_pending_rows=100000):
+        self.model = joblib.load(model_path)
+        self.scaler = joblib.load(scaler_path)
+        self.model_version = file_version(model_path)
+        self.calibrator = load_calibrator(calibrator_path, self.model, self.model_version)
+        self.stats = ShadowStats()
+        self.max_pending_rows = max_pending_rows
+        self.pending = 0
+        self.pending_rows = 0
+        self.skipped = 0
+        self.skipped_rows = 0
+        self.errors = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shadow")
+
+    def submit(self, features_array, live_predictions, live_confidences):
+        """
+        Queue shadow scoring of already parsed input
+
+        Args:
+            features_array (ndarray): Unscaled input of shape (n, 30), as built
+                for the live model; it must not be modified afterwards
+            live_predictions, live_confidences: The live model's results
+
+        Returns:
+            bool: False if the job was skipped because the backlog is full or
+            the scorer is closed; shadow scoring never raises into the caller
+        """
+        n_rows = len(features_array)
+        with self._lock:
+            if self.closed or self.pending_rows + n_rows > self.max_pending_rows:
+                self.skipped += 1
+                self.skipped_rows += n_rows
+                return False
+            self.pending += 1
+            self.pending_rows += n_rows
+        try:
+            self._executor.submit(self._score, features_array, live_predictions, live_confidences)
+        except Exception:
+            # Lost a race with close(); undo the reservation
+            with self._lock:
+                self.pending -= 1
+                self.pending_rows -= n_rows
+                self.skipped += 1
+                self.skipped_rows += n_rows
+            return False
+        return True
+
+    def _score(self, features_array, live_predictions, live_confidences):
+        try:
+            start = time.perf_counter()
+            shadow_predictions, shadow_confidences = score_decision(
+                self.model, self.calibrator, self.scaler.transform(features_array)
+            )
+            latency = time.perf_counter() - start
+            with self._lock:
+                self.stats.update(live_predictions, live_confidences,
+                                  shadow_predictions, shadow_confidences, latency)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            print(f"Shadow scoring error: {e}")
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.pending_rows -= len(features_array)
+
+    def summary(self):
+        with self._lock:
+            summary = self.stats.summary()
+            summary.update({
+                "model_version": self.model_version,
+                "pending": self.pending,
+                "pending_rows": self.pending_rows,
+                "skipped": self.skipped,
+                "skipped_rows": self.skipped_rows,
+                "errors": self.errors,
+            })
+        return summary
+
+    def close(self, wait=True):
+        with self._lock:
+            self.closed = True
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,192 @@
+"""
+Out-of-core training for exports far larger than memory
+
+The CSV (model/data.csv layout) is streamed in chunks. A first pass fits the
+StandardScaler with partial_fit, then every epoch maps each scaled chunk
+through random Fourier features approximating the RBF kernel and updates a
+linear SGD classifier. Every `holdout_every`-th row is kept out of training
+and a bounded sample of them is used to calibrate and evaluate the model.
+
+The artifacts (svm_model.pkl, scaler.pkl, calibrator.pkl) load directly in
+BreastCancerPredictor.
+
+    python app/train_out_of_core.py archive.csv --memory-mb 256 --epochs 5
+"""
+import argparse
+import os
+import time
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.kernel_approximation import RBFSampler
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from calibration import DecisionCalibrator
+from evaluation import StreamingEvaluator
+from model import file_version
+
+N_FEATURES = 30
+
+
+def chunk_rows_for_budget(memory_mb, n_components):
+    """
+    Rows per chunk so that one chunk's working arrays fit in memory_mb
+
+    A chunk holds the raw frame, the scaled copy and the mapped features,
+    with some slack for pandas parsing. Always at least one row.
+    """
+    bytes_per_row = 8 * (3 * N_FEATURES + 2 * n_components) * 2
+    return max(1, int(memory_mb * 1024 * 1024 // bytes_per_row))
+
+
+def iter_csv_chunks(path, chunksize):
+    """
+    Yield (X, y, first_row, row_index) chunks from a CSV in the model/data.csv layout
+
+    y is 1 for malignant (M) and 0 for benign (B); rows without a known
+    diagnosis are skipped. first_row is the file row index of the chunk start
+    and row_index the position of each kept row within the chunk.
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    feature_cols = list(header[2:2 + N_FEATURES])
+    first_row = 0
+    for chunk in pd.read_csv(path, usecols=["diagnosis"] + feature_cols, chunksize=chunksize):
+        y = chunk["diagnosis"].map({"M": 1, "B": 0}).to_numpy()
+        X = chunk[feature_cols].to_numpy(dtype=np.float64)
+        known = ~pd.isna(y)
+        yield X[known], y[known].astype(np.int64), first_row, np.flatnonzero(known)
+        first_row += len(chunk)
+
+
+class OutOfCoreTrainer:
+    """Train a kernel-approximated linear classifier over a streamed CSV"""
+
+    def __init__(self, memory_mb=256, n_components=500, gamma=None, alpha=1e-4,
+                 epochs=5, holdout_every=10, max_calibration_rows=100000, random_state=42):
+        self.memory_mb = memory_mb
+        self.n_components = n_components
+        self.gamma = gamma
+        self.alpha = alpha
+        self.epochs = epochs
+        self.holdout_every = holdout_every
+        self.max_calibration_rows = max_calibration_rows
+        self.random_state = random_state
+        self.chunksize = chunk_rows_for_budget(memory_mb, n_components)
+        self.scaler = None
+        self.model = None
+        self.calibrator = None
+        self.evaluator = None
+
+    def _split(self, first_row, row_index):
+        """Boolean mask of held-out rows within a chunk, stable across passes"""
+        return (first_row + row_index) % self.holdout_every == 0
+
+    def fit(self, path):
+        rng = np.random.default_rng(self.random_state)
+
+        # Pass 1: scaler statistics
+        self.scaler = StandardScaler()
+        n_rows = 0
+        for X, y, first_row, row_index in iter_csv_chunks(path, self.chunksize):
+            train = ~self._split(first_row, row_index)
+            if train.any():
+                self.scaler.partial_fit(X[train])
+                n_rows += int(train.sum())
+        if n_rows == 0:
+            raise ValueError(f"No labelled training rows in {path}")
+        print(f"Scaler fitted on {n_rows} rows (chunks of {self.chunksize} rows)")
+
+        # The default gamma matches SVC(gamma='scale') on standardised data
+        gamma = self.gamma if self.gamma is not None else 1.0 / N_FEATURES
+        feature_map = RBFSampler(gamma=gamma, n_components=self.n_components,
+                                 random_state=self.random_state)
+        feature_map.fit(np.zeros((1, N_FEATURES)))
+        classifier = SGDClassifier(loss="hinge", alpha=self.alpha, learning_rate="optimal",
+                                   random_state=self.random_state)
+
+        # Passes 2..epochs+1: SGD over the mapped features
+        for epoch in range(self.epochs):
+            start = time.perf_counter()
+            for X, y, first_row, row_index in iter_csv_chunks(path, self.chunksize):
+                train = ~self._split(first_row, row_index)
+                if not train.any():
+                    continue
+                order = rng.permutation(int(train.sum()))
+                Z = feature_map.transform(self.scaler.transform(X[train][order]))
+                classifier.partial_fit(Z, y[train][order], classes=np.array([0, 1]))
+            print(f"Epoch {epoch + 1}/{self.epochs} done in {time.perf_counter() - start:.1f}s")
+
+        self.model = Pipeline([("rbf", feature_map), ("sgd", classifier)])
+
+        # Final pass: bounded reservoir of held-out decision values
+        decisions = np.zeros(self.max_calibration_rows)
+        labels = np.zeros(self.max_calibration_rows, dtype=np.int64)
+        seen = 0
+        for X, y, first_row, row_index in iter_csv_chunks(path, self.chunksize):
+            held_out = self._split(first_row, row_index)
+            if not held_out.any():
+                continue
+            chunk_decisions = self.model.decision_function(self.scaler.transform(X[held_out]))
+            chunk_labels = y[held_out]
+            n = len(chunk_decisions)
+            fill = min(max(self.max_calibration_rows - seen, 0), n)
+            decisions[seen:seen + fill] = chunk_decisions[:fill]
+            labels[seen:seen + fill] = chunk_labels[:fill]
+            # Reservoir sampling for the rows beyond the budget
+            slots = rng.integers(0, seen + np.arange(fill, n) + 1)
+            replace = slots < self.max_calibration_rows
+            decisions[slots[replace]] = chunk_decisions[fill:][replace]
+            labels[slots[replace]] = chunk_labels[fill:][replace]
+            seen += n
+        kept = min(seen, self.max_calibration_rows)
+        order = rng.permutation(kept)
+        decisions, labels = decisions[order], labels[order]
+
+        if kept and len(np.unique(labels)) == 2:
+            # Calibrate on one half of the sample, evaluate on the other
+            half = kept // 2
+            self.calibrator = DecisionCalibrator("sigmoid").fit(decisions[:half], labels[:half])
+            positive_proba = self.calibrator.predict_proba(decisions[half:])
+            predictions = (decisions[half:] > 0).astype(np.int64)
+            confidences = np.where(predictions == 1, positive_proba, 1.0 - positive_proba)
+            self.evaluator = StreamingEvaluator()
+            self.evaluator.update(labels[half:], predictions, confidences)
+            print(f"Held-out accuracy: {self.evaluator.accuracy():.4f}, "
+                  f"ROC AUC: {self.evaluator.roc_auc():.4f}")
+        else:
+            print("Not enough held-out rows of both classes to calibrate, using a plain logistic mapping")
+            self.calibrator = DecisionCalibrator.from_svc(self.model)
+        return self
+
+    def save(self, output_dir="."):
+        """Write svm_model.pkl, scaler.pkl and calibrator.pkl for BreastCancerPredictor"""
+        model_path = os.path.join(output_dir, "svm_model.pkl")
+        joblib.dump(self.model, model_path)
+        joblib.dump(self.scaler, os.path.join(output_dir, "scaler.pkl"))
+        self.calibrator.model_version = file_version(model_path)
+        joblib.dump(self.calibrator, os.path.join(output_dir, "calibrator.pkl"))
+        print(f"Model, scaler and calibrator saved to {output_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Out-of-core training on a large CSV export")
+    parser.add_argument("csv", help="CSV in the model/data.csv layout")
+    parser.add_argument("--output-dir", default=".", help="Where to write the model artifacts")
+    parser.add_argument("--memory-mb", type=float, default=256, help="Working memory budget per chunk")
+    parser.add_argument("--components", type=int, default=500, help="Random Fourier features")
+    parser.add_argument("--gamma", type=float, default=None, help="RBF gamma (default 1/30)")
+    parser.add_argument("--alpha", type=float, default=1e-4, help="SGD regularisation strength")
+    parser.add_argument("--epochs", type=int, default=5, help="Passes over the data")
+    parser.add_argument("--holdout-every", type=int, default=10, help="Hold out every n-th row")
+    args = parser.parse_args()
+
+    trainer = OutOfCoreTrainer(memory_mb=args.memory_mb, n_components=args.components,
+                               gamma=args.gamma, alpha=args.alpha, epochs=args.epochs,
+                               holdout_every=args.holdout_every)
+    trainer.fit(args.csv)
+    trainer.save(args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
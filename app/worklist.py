@@ -0,0 +1,323 @@
+import numpy as np
+import pandas as pd
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QPushButton, QTableView, QHeaderView, QFileDialog,
+                             QMessageBox, QAbstractItemView)
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QThread, pyqtSignal)
+from PyQt6.QtGui import QColor, QFont
+from model import FEATURE_NAMES
+
+FIXED_COLUMNS = ["ID", "Actual", "Prediction", "Confidence"]
+DIAGNOSIS_NAMES = {0: "Benign", 1: "Malignant"}
+
+
+def load_worklist_csv(path):
+    """
+    Read a CSV in the model/data.csv layout
+
+    Returns:
+        tuple: (ids, actual, features) where actual is 1 for malignant, 0 for
+        benign and -1 when the diagnosis column is missing or blank
+    """
+    df = pd.read_csv(path)
+    df = df.loc[:, ~df.columns.str.startswith("Unnamed")]
+    ids = df["id"].to_numpy(dtype=np.int64) if "id" in df.columns else np.arange(len(df), dtype=np.int64)
+    if "diagnosis" in df.columns:
+        actual = df["diagnosis"].map({"M": 1, "B": 0}).fillna(-1).to_numpy(dtype=np.int8)
+        features = df.iloc[:, 2:32]
+    else:
+        actual = np.full(len(df), -1, dtype=np.int8)
+        features = df.iloc[:, 1:31]
+    return ids, actual, np.ascontiguousarray(features.to_numpy(dtype=np.float64))
+
+
+class WorklistModel(QAbstractTableModel):
+    """
+    Table model over NumPy columns for many patients at once
+
+    Cells are formatted only when the view asks for them, so only the visible
+    rows are ever materialised. Sorting and the confidence filter work on an
+    index array (`view_rows`) instead of moving the underlying data.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.actual = np.zeros(0, dtype=np.int8)
+        self.features = np.zeros((0, len(FEATURE_NAMES)), dtype=np.float64)
+        self.predictions = np.zeros(0, dtype=np.int8)
+        self.confidences = np.zeros(0, dtype=np.float32)
+        self.view_rows = np.zeros(0, dtype=np.int64)
+        self.sort_column = None
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        self.min_confidence = None
+        self.max_confidence = None
+        self.headers = FIXED_COLUMNS + FEATURE_NAMES
+
+    def set_data(self, ids, actual, features):
+        self.beginResetModel()
+        self.ids = ids
+        self.actual = actual
+        self.features = features
+        # -1 / NaN mark rows that have not been scored yet
+        self.predictions = np.full(len(ids), -1, dtype=np.int8)
+        self.confidences = np.full(len(ids), np.nan, dtype=np.float32)
+        self._rebuild_view()
+        self.endResetModel()
+
+    def set_scores(self, predictions, confidences):
+        self.beginResetModel()
+        self.predictions = np.asarray(predictions, dtype=np.int8)
+        self.confidences = np.asarray(confidences, dtype=np.float32)
+        self._rebuild_view()
+        self.endResetModel()
+
+    def set_confidence_filter(self, min_confidence=None, max_confidence=None):
+        """Only show scored rows whose confidence lies in [min, max]"""
+        self.beginResetModel()
+        self.min_confidence = min_confidence
+        self.max_confidence = max_confidence
+        self._rebuild_view()
+        self.endResetModel()
+
+    def source_row(self, view_row):
+        return int(self.view_rows[view_row])
+
+    def row_features(self, view_row):
+        return self.features[self.source_row(view_row)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.view_rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return section + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.view_rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return str(self.ids[row])
+            if col == 1:
+                return DIAGNOSIS_NAMES.get(int(self.actual[row]), "")
+            if col == 2:
+                return DIAGNOSIS_NAMES.get(int(self.predictions[row]), "Pending")
+            if col == 3:
+                confidence = self.confidences[row]
+                return "" if np.isnan(confidence) else f"{confidence:.1%}"
+            return f"{self.features[row, col - len(FIXED_COLUMNS)]:.5g}"
+
+        if role == Qt.ItemDataRole.ForegroundRole and col == 2:
+            if self.predictions[row] == 1:
+                return QColor("#ff6b6b")
+            if self.predictions[row] == 0:
+                return QColor("#51cf66")
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and col != 1 and col != 2:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_sources = [self.source_row(index.row()) for index in old_indexes]
+        self.sort_column = column
+        self.sort_order = order
+        self._rebuild_view()
+        # Move selections and the current index with their patients
+        view_of_source = np.full(len(self.ids), -1, dtype=np.int64)
+        view_of_source[self.view_rows] = np.arange(len(self.view_rows))
+        new_indexes = []
+        for index, source in zip(old_indexes, old_sources):
+            view_row = int(view_of_source[source])
+            new_indexes.append(self.index(view_row, index.column()) if view_row >= 0 else QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _sort_key(self, column):
+        if column == 0:
+            return self.ids
+        if column == 1:
+            return self.actual
+        if column == 2:
+            return self.predictions
+        if column == 3:
+            return self.confidences
+        return self.features[:, column - len(FIXED_COLUMNS)]
+
+    def _rebuild_view(self):
+        rows = np.arange(len(self.ids), dtype=np.int64)
+        if self.sort_column is not None and len(rows):
+            rows = np.argsort(self._sort_key(self.sort_column), kind="stable")
+            if self.sort_order == Qt.SortOrder.DescendingOrder:
+                rows = rows[::-1]
+        if self.min_confidence is not None or self.max_confidence is not None:
+            confidences = self.confidences[rows]
+            keep = ~np.isnan(confidences)
+            if self.min_confidence is not None:
+                keep &= confidences >= self.min_confidence
+            if self.max_confidence is not None:
+                keep &= confidences <= self.max_confidence
+            rows = rows[keep]
+        self.view_rows = np.ascontiguousarray(rows)
+
+
+class ScoringThread(QThread):
+    """Score the whole worklist with one predict_batch call off the UI thread"""
+
+    # (generation, predictions, confidences) and (generation, message)
+    scored = pyqtSignal(int, object, object)
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, predictor, features, generation, parent=None):
+        super().__init__(parent)
+        self.predictor = predictor
+        self.features = features
+        self.generation = generation
+
+    def run(self):
+        try:
+            predictions, confidences = self.predictor.predict_batch(self.features)
+            self.scored.emit(self.generation, predictions, confidences)
+        except Exception as e:
+            self.failed.emit(self.generation, str(e))
+
+
+class WorklistWindow(QWidget):
+    """Worklist of many cases; selecting a row fills the main detail form"""
+
+    row_selected = pyqtSignal(object)
+
+    def __init__(self, predictor, parent=None):
+        super().__init__(parent, Qt.WindowType.Window)
+        self.predictor = predictor
+        self.scoring_thread = None
+        # Bumped on every load so results from an older scoring run are ignored
+        self.generation = 0
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle("Patient Worklist")
+        self.resize(1100, 700)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+
+        controls = QHBoxLayout()
+        controls.setSpacing(10)
+
+        self.load_btn = QPushButton("Load CSV")
+        self.load_btn.setObjectName("secondaryButton")
+        self.load_btn.clicked.connect(self.choose_csv)
+
+        filter_label = QLabel("Confidence")
+        filter_label.setObjectName("seedLabel")
+        self.min_confidence_input = QLineEdit()
+        self.min_confidence_input.setObjectName("seedInput")
+        self.min_confidence_input.setPlaceholderText("min %")
+        self.min_confidence_input.setMaximumWidth(80)
+        self.max_confidence_input = QLineEdit()
+        self.max_confidence_input.setObjectName("seedInput")
+        self.max_confidence_input.setPlaceholderText("max %")
+        self.max_confidence_input.setMaximumWidth(80)
+        self.filter_btn = QPushButton("Filter")
+        self.filter_btn.setObjectName("secondaryButton")
+        self.filter_btn.clicked.connect(self.apply_filter)
+
+        self.status_label = QLabel("No worklist loaded")
+        self.status_label.setObjectName("seedLabel")
+
+        controls.addWidget(self.load_btn)
+        controls.addWidget(filter_label)
+        controls.addWidget(self.min_confidence_input)
+        controls.addWidget(self.max_confidence_input)
+        controls.addWidget(self.filter_btn)
+        controls.addStretch()
+        controls.addWidget(self.status_label)
+        layout.addLayout(controls)
+
+        self.table_model = WorklistModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setSortingEnabled(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setFont(QFont("Segoe UI", 9))
+        # Fixed row and column sizes keep the view from measuring every row
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(24)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setDefaultSectionSize(110)
+        self.table.selectionModel().currentRowChanged.connect(self.on_current_row_changed)
+        layout.addWidget(self.table, 1)
+
+    def choose_csv(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load worklist", "", "CSV files (*.csv)")
+        if path:
+            self.load_csv(path)
+
+    def load_csv(self, path):
+        try:
+            ids, actual, features = load_worklist_csv(path)
+        except Exception as e:
+            QMessageBox.critical(self, "Load Error", f"Could not load worklist: {str(e)}")
+            return
+        self.generation += 1
+        self.table_model.set_data(ids, actual, features)
+        self.status_label.setText(f"{len(ids)} cases, scoring...")
+        self.score()
+
+    def score(self):
+        self.scoring_thread = ScoringThread(self.predictor, self.table_model.features, self.generation, self)
+        self.scoring_thread.scored.connect(self.on_scored)
+        self.scoring_thread.failed.connect(self.on_scoring_failed)
+        self.scoring_thread.finished.connect(self.scoring_thread.deleteLater)
+        self.scoring_thread.start()
+
+    def on_scored(self, generation, predictions, confidences):
+        if generation != self.generation:
+            return
+        self.table_model.set_scores(predictions, confidences)
+        malignant = int((predictions == 1).sum())
+        self.status_label.setText(f"{len(predictions)} cases, {malignant} predicted malignant")
+
+    def on_scoring_failed(self, generation, message):
+        if generation != self.generation:
+            return
+        self.status_label.setText("Scoring failed")
+        QMessageBox.critical(self, "Prediction Error", f"An error occurred during prediction: {message}")
+
+    def apply_filter(self):
+        try:
+            bounds = []
+            for field in (self.min_confidence_input, self.max_confidence_input):
+                text = field.text().strip().rstrip("%")
+                bounds.append(float(text) / 100 if text else None)
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Filter", "Confidence bounds must be percentages.")
+            return
+        self.table_model.set_confidence_filter(*bounds)
+        self.status_label.setText(f"{self.table_model.rowCount()} of {len(self.table_model.ids)} cases shown")
+
+    def on_current_row_changed(self, current, previous):
+        if current.isValid():
+            self.row_selected.emit(self.table_model.row_features(current.row()))
+
+    def closeEvent(self, event):
+        # Superseded runs may still be going; they are children of this window
+        for thread in self.findChildren(ScoringThread):
+            thread.wait()
+        super().closeEvent(event)